@@ -2,10 +2,17 @@
 Performance analytics for PEA ETF Tracker.
 
 Provides portfolio value, returns, P&L, allocation, and risk calculations.
+
+The position-level math runs on Portfolio's memoized array columns
+(tickers/quantities/buy_prices) plus one fromiter pass that aligns the
+caller's ticker->price dict with those columns; everything after that
+bridge is NumPy reductions. The dict stays the interchange format because
+prices arrive keyed by ticker (fetches, cache, manual overrides).
 """
 
 import logging
-from typing import Dict
+import math
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
@@ -38,23 +45,34 @@ def calculate_portfolio_value(portfolio: Portfolio, prices: Dict[str, float]) ->
         >>> calculate_portfolio_value(portfolio, prices)
         2935.0
     """
-    total_value = 0.0
+    positions = portfolio.get_all_positions()
 
-    for position in portfolio.get_all_positions():
-        # Use manual price if set, otherwise use fetched price
-        effective_price = None
-        if position.manual_price is not None:
-            effective_price = position.manual_price
-        elif position.ticker in prices:
-            effective_price = prices[position.ticker]
-
-        if effective_price is not None:
-            position_value = position.quantity * effective_price
-            total_value += position_value
-        else:
-            logger.warning(f"Price not available for {position.ticker}, skipping")
+    if not positions:
+        return 0.0
 
-    return total_value
+    count = len(positions)
+    quantities = np.fromiter(
+        (position.quantity for position in positions), dtype=np.float64, count=count
+    )
+    effective_prices = np.fromiter(
+        (
+            position.manual_price
+            if position.manual_price is not None
+            else prices.get(position.ticker, np.nan)
+            for position in positions
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+
+    missing = np.isnan(effective_prices)
+    if missing.any():
+        skipped = [positions[i].ticker for i in np.flatnonzero(missing)]
+        logger.warning(f"Price not available for {', '.join(skipped)}, skipping")
+
+    # Positions without a price contribute no value
+    values = np.where(missing, 0.0, quantities * effective_prices)
+    return float(values.sum())
 
 
 def calculate_total_invested(portfolio: Portfolio) -> float:
@@ -74,12 +92,7 @@ def calculate_total_invested(portfolio: Portfolio) -> float:
         >>> calculate_total_invested(portfolio)
         2850.0
     """
-    total_invested = 0.0
-
-    for position in portfolio.get_all_positions():
-        total_invested += position.quantity * position.buy_price
-
-    return total_invested
+    return portfolio.total_invested
 
 
 def calculate_pnl(portfolio: Portfolio, prices: Dict[str, float]) -> float:
@@ -102,10 +115,97 @@ def calculate_pnl(portfolio: Portfolio, prices: Dict[str, float]) -> float:
         >>> calculate_pnl(portfolio, prices)
         85.0
     """
-    current_value = calculate_portfolio_value(portfolio, prices)
-    invested = calculate_total_invested(portfolio)
+    positions = portfolio.get_all_positions()
+
+    if not positions:
+        return 0.0
+
+    count = len(positions)
+    quantities = np.fromiter(
+        (position.quantity for position in positions), dtype=np.float64, count=count
+    )
+    buy_prices = np.fromiter(
+        (position.buy_price for position in positions), dtype=np.float64, count=count
+    )
+    effective_prices = np.fromiter(
+        (
+            position.manual_price
+            if position.manual_price is not None
+            else prices.get(position.ticker, np.nan)
+            for position in positions
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+
+    # Positions without a price contribute no value but their invested
+    # amount still counts (same semantics as value - invested).
+    deltas = np.where(
+        np.isnan(effective_prices), -buy_prices, effective_prices - buy_prices
+    )
+
+    return float(quantities @ deltas)
+
+
+def calculate_value_and_pnl(
+    portfolio: Portfolio, prices: Dict[str, float]
+) -> Tuple[float, float]:
+    """
+    Calculate portfolio value and P&L in a single pass.
+
+    Equivalent to calling calculate_portfolio_value and calculate_pnl, but
+    builds the quantity/price arrays once instead of twice — the status bar
+    needs both numbers after every refresh. Left unmemoized on purpose: the
+    vectorized pass is cheap and callers that can skip it (status bar,
+    dashboard) already keep their own last-shown keys.
+
+    Args:
+        portfolio: Portfolio object with positions.
+        prices: Dictionary mapping ticker to current price in EUR.
+
+    Returns:
+        Tuple of (total value, total P&L) in EUR. Returns (0.0, 0.0) if the
+        portfolio is empty.
 
-    return current_value - invested
+    Example:
+        >>> portfolio = Portfolio([
+        ...     ETFPosition("EWLD.PA", "Amundi World", 100, 28.50, date.today())
+        ... ])
+        >>> prices = {"EWLD.PA": 29.35}
+        >>> calculate_value_and_pnl(portfolio, prices)
+        (2935.0, 85.0)
+    """
+    positions = portfolio.get_all_positions()
+
+    if not positions:
+        return 0.0, 0.0
+
+    count = len(positions)
+    quantities = np.fromiter(
+        (position.quantity for position in positions), dtype=np.float64, count=count
+    )
+    buy_prices = np.fromiter(
+        (position.buy_price for position in positions), dtype=np.float64, count=count
+    )
+    effective_prices = np.fromiter(
+        (
+            position.manual_price
+            if position.manual_price is not None
+            else prices.get(position.ticker, np.nan)
+            for position in positions
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+
+    # Positions without a price contribute no value but their invested
+    # amount still counts toward P&L (same semantics as the split functions)
+    missing = np.isnan(effective_prices)
+    values = np.where(missing, 0.0, quantities * effective_prices)
+    total_value = float(values.sum())
+    pnl = total_value - float(quantities @ buy_prices)
+
+    return total_value, pnl
 
 
 def calculate_position_values(
@@ -170,17 +270,23 @@ def calculate_allocation(
         57.65
     """
     position_values = calculate_position_values(portfolio, prices)
-    total_value = sum(position_values.values())
+
+    if not position_values:
+        return {}
+
+    values = np.fromiter(
+        position_values.values(), dtype=np.float64, count=len(position_values)
+    )
+    total_value = float(values.sum())
 
     if total_value == 0.0:
         logger.warning("Total portfolio value is zero, cannot calculate allocation")
         return {}
 
-    allocations = {}
-    for ticker, value in position_values.items():
-        allocations[ticker] = (value / total_value) * 100.0
+    # Single reciprocal + vector multiply instead of one divide per position
+    percentages = values * (100.0 / total_value)
 
-    return allocations
+    return dict(zip(position_values.keys(), percentages.tolist()))
 
 
 def calculate_returns(
@@ -325,19 +431,27 @@ def calculate_sharpe_ratio(
         logger.warning("Returns series is empty, returning 0.0 Sharpe ratio")
         return 0.0
 
-    volatility = calculate_volatility(returns, annualize=False)
+    values = np.asarray(returns, dtype=np.float64)
+    n = values.size
 
-    if volatility == 0.0:
+    if n < 2:
         logger.warning("Volatility is zero, returning 0.0 Sharpe ratio")
         return 0.0
 
-    excess_returns = returns - risk_free_rate
-    mean_excess_return = float(excess_returns.mean())
+    # mean(excess) / std == (mean - rf) / std, so one mean pass and one
+    # centered dot product replace the separate mean/std/excess-mean walks
+    mean = float(values.sum()) / n
+    deviations = values - mean
+    variance = float(deviations @ deviations) / (n - 1)
+
+    if variance == 0.0:
+        logger.warning("Volatility is zero, returning 0.0 Sharpe ratio")
+        return 0.0
 
-    sharpe = mean_excess_return / volatility
+    sharpe = (mean - risk_free_rate) / math.sqrt(variance)
 
     if annualize:
-        sharpe *= np.sqrt(ANNUAL_TRADING_DAYS)
+        sharpe *= math.sqrt(ANNUAL_TRADING_DAYS)
 
     return sharpe
 
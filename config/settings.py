@@ -5,9 +5,11 @@ Handles loading, saving, and validation of user settings.
 Settings are persisted to ~/Library/Application Support/PEA_ETF_Tracker/config.json
 """
 
+import copy
 import json
 import logging
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -58,20 +60,17 @@ class Settings:
     chart_preferences: ChartPreferences
     last_portfolio_path: str
     window_geometry: WindowGeometry
+    # Prices younger than this skip the network entirely on refresh; older
+    # ones are served stale and revalidated in the background
+    price_fresh_ttl_seconds: int = 60
+    # Upper bound on concurrent price fetches (worker threads); keep modest
+    # to stay clear of upstream rate limits
+    max_fetch_concurrency: int = 8
 
 
-def get_default_settings() -> Settings:
-    """
-    Get default application settings.
-
-    Returns:
-        Settings object with sensible defaults.
-
-    Example:
-        >>> settings = get_default_settings()
-        >>> settings.default_currency
-        'EUR'
-    """
+@lru_cache(maxsize=1)
+def _default_settings_template() -> Settings:
+    """Build the canonical default Settings once; callers get deep copies."""
     return Settings(
         default_currency="EUR",
         data_source="yfinance",
@@ -117,9 +116,29 @@ def get_default_settings() -> Settings:
             x=100,
             y=100,
         ),
+        price_fresh_ttl_seconds=60,
+        max_fetch_concurrency=8,
     )
 
 
+def get_default_settings() -> Settings:
+    """
+    Get default application settings.
+
+    Returns a deep copy of a memoized template, so repeated calls skip
+    rebuilding the dataclass tree while callers can still mutate freely.
+
+    Returns:
+        Settings object with sensible defaults.
+
+    Example:
+        >>> settings = get_default_settings()
+        >>> settings.default_currency
+        'EUR'
+    """
+    return copy.deepcopy(_default_settings_template())
+
+
 def _settings_to_dict(settings: Settings) -> Dict[str, Any]:
     """
     Convert Settings object to dictionary for JSON serialization.
@@ -174,6 +193,9 @@ def _dict_to_settings(data: Dict[str, Any]) -> Settings:
             x=data["window_geometry"]["x"],
             y=data["window_geometry"]["y"],
         ),
+        # Absent in configs written by older versions
+        price_fresh_ttl_seconds=data.get("price_fresh_ttl_seconds", 60),
+        max_fetch_concurrency=data.get("max_fetch_concurrency", 8),
     )
 
 
@@ -6,10 +6,17 @@ Fetches ETF prices from Yahoo Finance with local caching for offline support.
 
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
+import orjson
 import pandas as pd
+import requests
+import requests_cache
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
@@ -17,11 +24,138 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = Path.home() / "Library/Application Support/PEA_ETF_Tracker/cache"
 CACHE_FILE = CACHE_DIR / "prices.json"
 
+# HTTP responses from Yahoo Finance are cached for this many seconds so that
+# repeated quote requests within a session skip the network round-trip.
+HTTP_CACHE_EXPIRE_SECONDS = 300
+
+_http_session: Optional[requests_cache.CachedSession] = None
+_http_cache_hits = 0
+_http_cache_misses = 0
+
+# In-memory TTL cache for quotes: repeated refreshes within the window are
+# answered without touching the network or even the HTTP cache. Guarded by a
+# lock because fetch_prices fans out over worker threads.
+PRICE_MEMORY_TTL_SECONDS = 60
+_price_memory: Dict[str, tuple] = {}  # ticker -> (price, monotonic ts)
+_price_memory_lock = threading.Lock()
+
+
+def _get_memory_price(ticker: str) -> Optional[float]:
+    """Return the in-memory price for ticker if still within its TTL."""
+    with _price_memory_lock:
+        entry = _price_memory.get(ticker)
+    if entry is None:
+        return None
+    price, ts = entry
+    if time.monotonic() - ts >= PRICE_MEMORY_TTL_SECONDS:
+        return None
+    return price
+
+
+def _store_memory_price(ticker: str, price: float) -> None:
+    """Record a freshly fetched price in the in-memory TTL cache."""
+    with _price_memory_lock:
+        _price_memory[ticker] = (price, time.monotonic())
+
+
+def clear_price_memory() -> None:
+    """
+    Drop all in-memory TTL price entries.
+
+    Tests call this between runs to keep quote caching state isolated.
+
+    Example:
+        >>> clear_price_memory()
+    """
+    with _price_memory_lock:
+        _price_memory.clear()
+
+
+def _get_http_session() -> requests_cache.CachedSession:
+    """
+    Get the shared cached HTTP session for Yahoo Finance requests.
+
+    The session is created lazily on first use with an SQLite backend in the
+    cache directory, so imports stay side-effect free.
+
+    Returns:
+        Shared CachedSession instance.
+    """
+    global _http_session
+
+    if _http_session is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _http_session = requests_cache.CachedSession(
+            str(CACHE_DIR / "yf_http_cache"),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        )
+        # Size the keep-alive pool for the batch fan-out so concurrent
+        # fetch_price workers reuse warm TLS connections instead of
+        # evicting each other from the default 10-connection pool
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8, pool_maxsize=16
+        )
+        _http_session.mount("https://", adapter)
+        _http_session.hooks["response"].append(_track_cache_usage)
+        logger.debug("Created cached HTTP session for Yahoo Finance")
+
+    return _http_session
+
+
+def _track_cache_usage(response: requests_cache.AnyResponse, **kwargs: object) -> None:
+    """Response hook counting HTTP cache hits and misses."""
+    global _http_cache_hits, _http_cache_misses
+
+    if getattr(response, "from_cache", False):
+        _http_cache_hits += 1
+    else:
+        _http_cache_misses += 1
+
+
+def get_http_cache_stats() -> Dict[str, int]:
+    """
+    Get HTTP cache hit/miss counters for profiling.
+
+    Returns:
+        Dictionary with "hits" and "misses" counts for the current session.
+
+    Example:
+        >>> stats = get_http_cache_stats()
+        >>> print(stats["hits"], stats["misses"])
+    """
+    return {"hits": _http_cache_hits, "misses": _http_cache_misses}
+
+
+def clear_http_cache() -> None:
+    """
+    Clear the cached HTTP session and reset hit/miss counters.
+
+    No-op if the session was never created. Tests call this between runs
+    to keep HTTP caching state isolated.
+
+    Example:
+        >>> clear_http_cache()
+    """
+    global _http_session, _http_cache_hits, _http_cache_misses
+
+    if _http_session is not None:
+        _http_session.cache.clear()
+        _http_session = None
+
+    _http_cache_hits = 0
+    _http_cache_misses = 0
+
 
 def load_price_cache() -> Dict[str, float]:
     """
     Load cached prices from file.
 
+    Entries deliberately carry no TTL: the file cache is the offline
+    fallback and the startup seed, where a stale price beats no price.
+    Freshness is enforced upstream by the in-memory TTL cache here and
+    the per-ticker fetch timestamps in the main window.
+
     Returns:
         Dictionary mapping ticker to price. Empty dict if file doesn't exist.
 
@@ -75,13 +209,14 @@ def save_price_cache(prices: Dict[str, float]) -> None:
         # Ensure cache directory exists
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Save with timestamp for future use
-        cache_data = {
-            "prices": prices,
-        }
+        # Serialize the whole payload at once, then write + atomic rename so
+        # a crash mid-save never leaves a truncated cache file behind.
+        data = orjson.dumps({"prices": prices})
 
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
+        tmp_file = CACHE_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, CACHE_FILE)
 
         logger.debug(f"Price cache saved with {len(prices)} tickers")
 
@@ -140,8 +275,14 @@ def fetch_price(ticker: str, use_cache: bool = True) -> Optional[float]:
         >>> if price:
         ...     print(f"Price: {price} EUR")
     """
+    if use_cache:
+        memory_price = _get_memory_price(ticker)
+        if memory_price is not None:
+            logger.debug(f"Memory-cached price for {ticker}: {memory_price} EUR")
+            return memory_price
+
     try:
-        etf = yf.Ticker(ticker)
+        etf = yf.Ticker(ticker, session=_get_http_session())
         info = etf.info
 
         # Try to get current price from various fields
@@ -149,6 +290,7 @@ def fetch_price(ticker: str, use_cache: bool = True) -> Optional[float]:
 
         if price:
             logger.info(f"Fetched price for {ticker}: {price} EUR")
+            _store_memory_price(ticker, float(price))
             update_price_cache(ticker, float(price))
             return float(price)
 
@@ -172,6 +314,68 @@ def fetch_price(ticker: str, use_cache: bool = True) -> Optional[float]:
         return None
 
 
+def fetch_prices(
+    tickers: List[str],
+    use_cache: bool = True,
+    max_concurrency: int = 8,
+    on_price: Optional[Callable[[str, float], None]] = None,
+) -> Dict[str, float]:
+    """
+    Fetch current prices for several tickers in one batch.
+
+    Yahoo Finance serves one quote per request, so the batch is issued as
+    concurrent fetch_price calls over the shared HTTP session rather than a
+    comma-separated query; the requests overlap their network round-trips
+    and total latency approaches that of the slowest single quote.
+    (yfinance's multi-ticker download endpoint is not a substitute: it
+    returns daily OHLC bars, not the live regularMarketPrice quote, and
+    would bypass the per-ticker cache fallback chain.) A
+    thread pool (not asyncio) does the fan-out because yfinance and
+    requests-cache are synchronous; max_workers plays the role an async
+    semaphore would, bounding in-flight requests.
+
+    Args:
+        tickers: Ticker symbols to fetch.
+        use_cache: If True, fall back to cached prices on network failure.
+        max_concurrency: Upper bound on parallel quote requests.
+        on_price: Optional callback invoked as each price arrives, from the
+            worker thread that fetched it.
+
+    Returns:
+        Dictionary mapping ticker to price; tickers without a price are
+        omitted.
+
+    Example:
+        >>> prices = fetch_prices(["EWLD.PA", "PE500.PA"])
+        >>> prices["EWLD.PA"]
+        29.35
+    """
+    prices: Dict[str, float] = {}
+    if not tickers:
+        return prices
+
+    # The worker cap keeps us clear of upstream rate limits
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(tickers))) as executor:
+        futures = {
+            executor.submit(fetch_price, ticker, use_cache): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                price = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching price for {ticker}: {e}")
+                continue
+            if price:
+                prices[ticker] = price
+                if on_price is not None:
+                    on_price(ticker, price)
+
+    logger.info(f"Batch fetched {len(prices)}/{len(tickers)} prices")
+    return prices
+
+
 def fetch_historical_data(ticker: str, period: str = "1mo") -> pd.DataFrame:
     """
     Fetch historical price data for ticker.
@@ -190,7 +394,7 @@ def fetch_historical_data(ticker: str, period: str = "1mo") -> pd.DataFrame:
         ...     print(f"Fetched {len(df)} days of data")
     """
     try:
-        etf = yf.Ticker(ticker)
+        etf = yf.Ticker(ticker, session=_get_http_session())
         hist: pd.DataFrame = etf.history(period=period)
 
         if hist.empty:
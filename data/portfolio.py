@@ -5,21 +5,66 @@ Manages ETF positions and portfolio persistence (JSON and CSV).
 """
 
 import csv
-import json
 import logging
+import os
+import re
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson
+
+try:
+    # Optional: Rust-backed vectorized CSV parsing; stdlib csv is the fallback
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+CSV_HEADER = "Ticker,Name,Quantity,BuyPrice,BuyDate,ManualPrice"
+
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date string, caching repeats (bulk buys share dates)."""
+    return date.fromisoformat(value)
+
+
+def _parse_csv_date(value: Optional[str]) -> date:
+    """
+    Parse a CSV date field, rejecting malformed input without raising from
+    deep inside fromisoformat.
+
+    The regex is a cheap shape gate; semantically invalid dates such as
+    "2024-13-01" still raise ValueError from the real parser.
+    """
+    if not value or not _DATE_RE.fullmatch(value):
+        raise ValueError(f"invalid date: {value!r}")
+    return _parse_date(value)
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field only when it actually needs quoting."""
+    if '"' in value or "," in value or "\n" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ETFPosition:
     """
     Represents a single ETF position in the portfolio.
 
+    Immutable: use dataclasses.replace() to derive a modified position and
+    Portfolio.update_position() to swap it in.
+
     Attributes:
         ticker: ETF ticker symbol (e.g., "EWLD.PA")
         name: ETF name (e.g., "Amundi MSCI World UCITS ETF")
@@ -90,7 +135,7 @@ class ETFPosition:
             name=data["name"],
             quantity=float(data["quantity"]),
             buy_price=float(data["buy_price"]),
-            buy_date=date.fromisoformat(data["buy_date"]),
+            buy_date=_parse_date(data["buy_date"]),
             manual_price=float(data["manual_price"])
             if data.get("manual_price")
             else None,
@@ -116,8 +161,80 @@ class Portfolio:
 
         Args:
             positions: Optional list of ETFPosition objects.
+
+        Raises:
+            ValueError: If two positions share the same ticker.
+        """
+        # Ticker-indexed store: O(1) lookup/duplicate checks, and dicts
+        # preserve insertion order so position ordering is unchanged.
+        self._by_ticker: Dict[str, ETFPosition] = {}
+        self._version = 0
+        # (version, bytes) memo for to_json_bytes; manual save and
+        # auto-save of the same state share one encode
+        self._json_memo: Optional[tuple] = None
+        for position in positions if positions is not None else []:
+            if position.ticker in self._by_ticker:
+                raise ValueError(
+                    f"Ticker {position.ticker} already exists in portfolio"
+                )
+            self._by_ticker[position.ticker] = position
+
+    @property
+    def positions(self) -> List[ETFPosition]:
+        """All positions in insertion order."""
+        return list(self._by_ticker.values())
+
+    @cached_property
+    def tickers(self) -> tuple:
+        """Ticker symbols in insertion order (SoA column)."""
+        return tuple(self._by_ticker)
+
+    @cached_property
+    def quantities(self) -> "np.ndarray":
+        """Quantities as a float64 vector, aligned with tickers."""
+        return np.fromiter(
+            (p.quantity for p in self._by_ticker.values()),
+            dtype=np.float64,
+            count=len(self._by_ticker),
+        )
+
+    @cached_property
+    def buy_prices(self) -> "np.ndarray":
+        """Buy prices as a float64 vector, aligned with tickers."""
+        return np.fromiter(
+            (p.buy_price for p in self._by_ticker.values()),
+            dtype=np.float64,
+            count=len(self._by_ticker),
+        )
+
+    @cached_property
+    def total_invested(self) -> float:
+        """
+        Total amount invested (buy_price × quantity) across all positions.
+
+        Memoized until positions change; add/remove/update invalidate it.
+
+        Example:
+            >>> portfolio.total_invested
+            2850.0
         """
-        self.positions: List[ETFPosition] = positions if positions is not None else []
+        return float(self.quantities @ self.buy_prices)
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped on every mutation.
+
+        Cheap cache key for consumers that derive values from positions:
+        equal versions (for the same Portfolio) mean unchanged positions.
+        """
+        return self._version
+
+    def _invalidate_derived(self) -> None:
+        """Drop memoized values after a positions change."""
+        self._version += 1
+        for name in ("tickers", "quantities", "buy_prices", "total_invested"):
+            self.__dict__.pop(name, None)
 
     def add_position(self, position: ETFPosition) -> None:
         """
@@ -133,10 +250,11 @@ class Portfolio:
             >>> portfolio.add_position(position)
         """
         # Check if ticker already exists
-        if any(p.ticker == position.ticker for p in self.positions):
+        if position.ticker in self._by_ticker:
             raise ValueError(f"Ticker {position.ticker} already exists in portfolio")
 
-        self.positions.append(position)
+        self._by_ticker[position.ticker] = position
+        self._invalidate_derived()
         logger.info(f"Added position: {position.ticker}")
 
     def remove_position(self, ticker: str) -> None:
@@ -152,13 +270,12 @@ class Portfolio:
         Example:
             >>> portfolio.remove_position("EWLD.PA")
         """
-        for i, position in enumerate(self.positions):
-            if position.ticker == ticker:
-                self.positions.pop(i)
-                logger.info(f"Removed position: {ticker}")
-                return
+        if ticker not in self._by_ticker:
+            raise ValueError(f"Ticker {ticker} not found in portfolio")
 
-        raise ValueError(f"Ticker {ticker} not found in portfolio")
+        del self._by_ticker[ticker]
+        self._invalidate_derived()
+        logger.info(f"Removed position: {ticker}")
 
     def update_position(self, ticker: str, new_position: ETFPosition) -> None:
         """
@@ -169,23 +286,43 @@ class Portfolio:
             new_position: New ETFPosition data.
 
         Raises:
-            ValueError: If ticker not found in portfolio.
+            ValueError: If ticker not found in portfolio, or if renaming
+                onto a ticker that already exists.
 
         Example:
             >>> portfolio.update_position("EWLD.PA", new_position)
         """
-        for i, position in enumerate(self.positions):
-            if position.ticker == ticker:
-                self.positions[i] = new_position
-                logger.info(f"Updated position: {ticker}")
-                return
+        if ticker not in self._by_ticker:
+            raise ValueError(f"Ticker {ticker} not found in portfolio")
+
+        # A rename onto an existing ticker would collapse two positions
+        # into one slot when the index is rebuilt below
+        if new_position.ticker != ticker and new_position.ticker in self._by_ticker:
+            raise ValueError(
+                f"Ticker {new_position.ticker} already exists in portfolio"
+            )
 
-        raise ValueError(f"Ticker {ticker} not found in portfolio")
+        if new_position.ticker == ticker:
+            self._by_ticker[ticker] = new_position
+        else:
+            # Ticker changed: rebuild the index so the position keeps its slot
+            self._by_ticker = {
+                (new_position.ticker if key == ticker else key): (
+                    new_position if key == ticker else position
+                )
+                for key, position in self._by_ticker.items()
+            }
+
+        self._invalidate_derived()
+        logger.info(f"Updated position: {ticker}")
 
     def get_position(self, ticker: str) -> Optional[ETFPosition]:
         """
         Get position by ticker symbol.
 
+        O(1): positions are stored in a ticker-keyed dict, so the per-click
+        lookups in the UI handlers never scan the whole portfolio.
+
         Args:
             ticker: Ticker symbol to find.
 
@@ -195,10 +332,7 @@ class Portfolio:
         Example:
             >>> position = portfolio.get_position("EWLD.PA")
         """
-        for position in self.positions:
-            if position.ticker == ticker:
-                return position
-        return None
+        return self._by_ticker.get(ticker)
 
     def get_all_positions(self) -> List[ETFPosition]:
         """
@@ -210,14 +344,59 @@ class Portfolio:
         Example:
             >>> positions = portfolio.get_all_positions()
         """
-        return self.positions.copy()
+        return list(self._by_ticker.values())
+
+    def _to_list_of_dicts(self) -> List[Dict[str, Any]]:
+        """Serialize all positions in one pass (bulk form of to_dict)."""
+        # Inline the per-position dict literal: no method dispatch per row,
+        # and date.isoformat is looked up once instead of per position.
+        iso = date.isoformat
+        return [
+            {
+                "ticker": p.ticker,
+                "name": p.name,
+                "quantity": p.quantity,
+                "buy_price": p.buy_price,
+                "buy_date": iso(p.buy_date),
+                "manual_price": p.manual_price,
+            }
+            for p in self._by_ticker.values()
+        ]
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the portfolio to its JSON file representation.
+
+        Memoized on the version counter, so back-to-back saves of an
+        unchanged portfolio (manual save plus auto-save) encode once.
+
+        Returns:
+            JSON document as bytes, ready to be written to disk.
+
+        Example:
+            >>> payload = portfolio.to_json_bytes()
+        """
+        if self._json_memo is not None and self._json_memo[0] == self._version:
+            return self._json_memo[1]
+
+        data = {"positions": self._to_list_of_dicts()}
+        # orjson serializes in C and returns bytes: one encode, one write
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        self._json_memo = (self._version, payload)
+        return payload
 
-    def save_to_json(self, path: Path) -> None:
+    def save_to_json(self, path: Path, fsync: bool = False) -> None:
         """
         Save portfolio to JSON file.
 
+        The document is written to a sibling temp file and swapped in with
+        os.replace, so a crash mid-write never leaves half a portfolio.
+
         Args:
             path: Path to JSON file.
+            fsync: If True, force the bytes to disk before the swap. Worth
+                the stall for explicit user saves; auto-saves leave
+                durability to the OS write cache.
 
         Raises:
             OSError: If unable to write file.
@@ -225,10 +404,13 @@ class Portfolio:
         Example:
             >>> portfolio.save_to_json(Path("portfolio.json"))
         """
-        data = {"positions": [position.to_dict() for position in self.positions]}
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_json_bytes())
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
         logger.info(f"Portfolio saved to {path}")
 
@@ -251,8 +433,7 @@ class Portfolio:
         Example:
             >>> portfolio = Portfolio.load_from_json(Path("portfolio.json"))
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
 
         positions = [ETFPosition.from_dict(pos_data) for pos_data in data["positions"]]
 
@@ -274,25 +455,44 @@ class Portfolio:
         Example:
             >>> portfolio.export_to_csv(Path("portfolio.csv"))
         """
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                ["Ticker", "Name", "Quantity", "BuyPrice", "BuyDate", "ManualPrice"]
+        positions = self.positions
+
+        if pl is not None:
+            # Column-wise build + one vectorized write instead of per-row calls
+            df = pl.DataFrame(
+                {
+                    "Ticker": [p.ticker for p in positions],
+                    "Name": [p.name for p in positions],
+                    "Quantity": [p.quantity for p in positions],
+                    "BuyPrice": [p.buy_price for p in positions],
+                    "BuyDate": [p.buy_date for p in positions],
+                    "ManualPrice": [p.manual_price for p in positions],
+                },
+                schema={
+                    "Ticker": pl.Utf8,
+                    "Name": pl.Utf8,
+                    "Quantity": pl.Float64,
+                    "BuyPrice": pl.Float64,
+                    "BuyDate": pl.Date,
+                    "ManualPrice": pl.Float64,
+                },
             )
-
-            for position in self.positions:
-                writer.writerow(
-                    [
-                        position.ticker,
-                        position.name,
-                        position.quantity,
-                        position.buy_price,
-                        position.buy_date.isoformat(),
-                        position.manual_price
-                        if position.manual_price is not None
-                        else "",
-                    ]
+            df.write_csv(path)
+        else:
+            # Pre-format all rows and write the file in one call instead of
+            # going through csv.writer's per-row machinery. The row buffer is
+            # preallocated since the length is known up front.
+            lines = [""] * (len(positions) + 1)
+            lines[0] = CSV_HEADER
+            for i, p in enumerate(positions, 1):
+                manual = "" if p.manual_price is None else p.manual_price
+                lines[i] = (
+                    f"{p.ticker},{_csv_field(p.name)},{p.quantity},"
+                    f"{p.buy_price},{p.buy_date.isoformat()},{manual}"
                 )
+            # Encode once and write bytes directly, skipping the TextIOWrapper
+            # per-write encode/newline-translation machinery
+            path.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
         logger.info(f"Portfolio exported to {path}")
 
@@ -318,41 +518,89 @@ class Portfolio:
         Example:
             >>> portfolio = Portfolio.import_from_csv(Path("demo_portfolio.csv"))
         """
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        required_columns = {"Ticker", "Name", "Quantity", "BuyPrice", "BuyDate"}
+
+        if pl is not None:
+            try:
+                df = pl.read_csv(
+                    path,
+                    schema_overrides={
+                        "Quantity": pl.Float64,
+                        "BuyPrice": pl.Float64,
+                        "ManualPrice": pl.Float64,
+                    },
+                )
+            except pl.exceptions.PolarsError as e:
+                raise ValueError(f"Invalid data in CSV file {path}: {e}") from e
 
             # Verify required columns
             # (ManualPrice is optional for backward compatibility)
-            required_columns = {"Ticker", "Name", "Quantity", "BuyPrice", "BuyDate"}
-            if reader.fieldnames is None or not required_columns.issubset(
-                set(reader.fieldnames)
-            ):
+            if not required_columns.issubset(set(df.columns)):
                 raise ValueError(
                     f"CSV file missing required columns. "
                     f"Expected: {required_columns}, "
-                    f"Found: {reader.fieldnames}"
+                    f"Found: {df.columns}"
+                )
+
+            if "ManualPrice" not in df.columns:
+                df = df.with_columns(
+                    pl.lit(None, dtype=pl.Float64).alias("ManualPrice")
                 )
 
             positions = []
-            for row in reader:
+            for row in df.iter_rows(named=True):
                 try:
-                    # Get manual_price if column exists, otherwise None
-                    manual_price_str = row.get("ManualPrice", "")
-                    manual_price = float(manual_price_str) if manual_price_str else None
-
+                    # Columns are already typed; only the date needs parsing
                     position = ETFPosition(
                         ticker=row["Ticker"],
                         name=row["Name"],
                         quantity=float(row["Quantity"]),
                         buy_price=float(row["BuyPrice"]),
-                        buy_date=date.fromisoformat(row["BuyDate"]),
-                        manual_price=manual_price,
+                        buy_date=_parse_csv_date(row["BuyDate"]),
+                        manual_price=row["ManualPrice"],
                     )
                     positions.append(position)
-                except (ValueError, KeyError) as e:
+                except (ValueError, KeyError, TypeError) as e:
                     raise ValueError(
                         f"Invalid data in CSV row: {row}. Error: {e}"
                     ) from e
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+
+                # Verify required columns
+                # (ManualPrice is optional for backward compatibility)
+                if reader.fieldnames is None or not required_columns.issubset(
+                    set(reader.fieldnames)
+                ):
+                    raise ValueError(
+                        f"CSV file missing required columns. "
+                        f"Expected: {required_columns}, "
+                        f"Found: {reader.fieldnames}"
+                    )
+
+                positions = []
+                for row in reader:
+                    try:
+                        # Get manual_price if column exists, otherwise None
+                        manual_price_str = row.get("ManualPrice", "")
+                        manual_price = (
+                            float(manual_price_str) if manual_price_str else None
+                        )
+
+                        position = ETFPosition(
+                            ticker=row["Ticker"],
+                            name=row["Name"],
+                            quantity=float(row["Quantity"]),
+                            buy_price=float(row["BuyPrice"]),
+                            buy_date=_parse_csv_date(row["BuyDate"]),
+                            manual_price=manual_price,
+                        )
+                        positions.append(position)
+                    except (ValueError, KeyError) as e:
+                        raise ValueError(
+                            f"Invalid data in CSV row: {row}. Error: {e}"
+                        ) from e
 
         logger.info(f"Portfolio imported from {path} with {len(positions)} positions")
         return cls(positions)
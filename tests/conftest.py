@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for PEA ETF Tracker tests.
+"""
+
+import os
+import sys
+from datetime import date
+from typing import Iterator, List
+
+import pytest
+
+from data.market_data import clear_http_cache, clear_price_memory
+from data.portfolio import ETFPosition, Portfolio
+
+# Allow xdist workers to bring up their own QApplication without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+    worker_id: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Give each test (and each xdist worker) its own price cache directory."""
+    cache_dir = tmp_path_factory.mktemp(f"cache_{worker_id}")
+    monkeypatch.setattr("data.market_data.CACHE_DIR", cache_dir)
+    monkeypatch.setattr("data.market_data.CACHE_FILE", cache_dir / "prices.json")
+
+
+@pytest.fixture(autouse=True)
+def _no_startup_prefetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable MainWindow's construction-time price prefetch.
+
+    Building a window around a populated portfolio would otherwise spawn
+    pool threads doing real Yahoo Finance requests, and leave them
+    running past teardown. Tests that exercise fetching call
+    _refresh_prices explicitly with the network layer mocked. Guarded on
+    sys.modules so data-only test runs never import Qt.
+    """
+    window_module = sys.modules.get("ui.main_window")
+    if window_module is not None:
+        monkeypatch.setattr(window_module.MainWindow, "PREFETCH_ON_STARTUP", False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_cache() -> Iterator[None]:
+    """Clear the shared HTTP and in-memory quote caches between tests."""
+    yield
+    clear_http_cache()
+    clear_price_memory()
+
+
+@pytest.fixture(scope="session")
+def two_positions() -> List[ETFPosition]:
+    """The standard two-position list; frozen positions are safely shared."""
+    return [
+        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
+        ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
+    ]
+
+
+@pytest.fixture
+def two_position_portfolio(two_positions: List[ETFPosition]) -> Portfolio:
+    """A fresh Portfolio around the shared two-position list."""
+    return Portfolio(list(two_positions))
@@ -4,7 +4,7 @@ Tests for visuals.charts module.
 Tests chart generation functions for portfolio visualization.
 """
 
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 
 import plotly.graph_objects as go
@@ -12,6 +12,7 @@ import pytest
 
 from config.settings import ChartPreferences
 from visuals.charts import (
+    _MAX_RENDER_POINTS,
     apply_chart_theme,
     create_allocation_bar_chart,
     create_allocation_pie_chart,
@@ -68,7 +69,7 @@ def test_create_portfolio_value_chart_returns_figure(
 
     assert isinstance(fig, go.Figure)
     assert len(fig.data) == 1
-    assert fig.data[0].type == "scatter"
+    assert fig.data[0].type == "scattergl"
 
 
 def test_create_portfolio_value_chart_has_correct_data(
@@ -235,7 +236,7 @@ def test_create_performance_chart_returns_figure(
 
     assert isinstance(fig, go.Figure)
     assert len(fig.data) == 1
-    assert fig.data[0].type == "scatter"
+    assert fig.data[0].type == "scattergl"
 
 
 def test_create_performance_chart_includes_ticker_in_title(
@@ -256,7 +257,7 @@ def test_create_performance_chart_with_line_type(
         sample_dates, sample_values, "EWLD.PA", chart_type="line"
     )
 
-    assert fig.data[0].type == "scatter"
+    assert fig.data[0].type == "scattergl"
     assert fig.data[0].mode == "lines"
 
 
@@ -290,6 +291,29 @@ def test_create_performance_chart_with_empty_data() -> None:
         create_performance_chart([], [], "EWLD.PA")
 
 
+def test_create_performance_chart_decimates_long_series() -> None:
+    """create_performance_chart() downsamples series beyond the render cap."""
+    n = 5000
+    dates = [date(2010, 1, 1) + timedelta(days=i) for i in range(n)]
+    prices = [100.0 + (i % 250) * 0.1 for i in range(n)]
+
+    fig = create_performance_chart(dates, prices, "EWLD.PA")
+
+    assert len(fig.data[0].y) == _MAX_RENDER_POINTS
+    # Endpoints survive decimation
+    assert fig.data[0].y[0] == prices[0]
+    assert fig.data[0].y[-1] == prices[-1]
+
+
+def test_create_performance_chart_keeps_short_series_intact(
+    sample_dates: list[date], sample_values: list[float]
+) -> None:
+    """create_performance_chart() renders short series point-for-point."""
+    fig = create_performance_chart(sample_dates, sample_values, "EWLD.PA")
+
+    assert list(fig.data[0].y) == sample_values
+
+
 def test_create_performance_chart_with_mismatched_lengths(
     sample_dates: list[date],
 ) -> None:
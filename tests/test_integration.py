@@ -270,7 +270,13 @@ def test_main_window_portfolio_table_integration(
 
 
 def test_main_window_loads_geometry_from_settings(qtbot: QtBot) -> None:
-    """Main window loads geometry from settings."""
+    """Main window falls back to JSON geometry without a QSettings entry."""
+    from PyQt6.QtCore import QSettings
+
+    # Geometry is primarily stored in QSettings; drop any entry left by
+    # other tests so the JSON fallback path is exercised
+    QSettings("PEA", "ETFTracker").remove("geometry")
+
     settings = get_default_settings()
     settings.window_geometry.width = 1400
     settings.window_geometry.height = 900
@@ -480,12 +486,16 @@ def test_main_window_dashboard_tab_exists(
 def test_main_window_chart_tab_exists(
     qtbot: QtBot, sample_portfolio: Portfolio
 ) -> None:
-    """Main window has chart tab."""
+    """Main window builds the chart widget on first view of its tab."""
     settings = get_default_settings()
     window = MainWindow(settings, sample_portfolio)
     qtbot.addWidget(window)
 
-    assert hasattr(window, "chart_widget")
+    # Built lazily: absent until the Charts tab is selected
+    assert window.chart_widget is None
+
+    window.tabs.setCurrentIndex(2)
+
     assert window.chart_widget is not None
 
 
@@ -811,9 +821,9 @@ def test_main_window_add_position_updates_table(
     # Mock position dialog to return a new position
     from ui.position_dialog import PositionDialog
 
-    def mock_exec(self) -> int:
+    def mock_open(self) -> None:
         # type: ignore
-        # Simulate user entering position data
+        # Simulate user entering position data and accepting
         from PyQt6.QtCore import QDate
 
         self.ticker_input.setText("PCEU.PA")
@@ -821,9 +831,9 @@ def test_main_window_add_position_updates_table(
         self.quantity_input.setValue(75.0)
         self.buy_price_input.setValue(40.00)
         self.date_input.setDate(QDate(2024, 5, 1))
-        return 1  # Accepted
+        self.accept()
 
-    monkeypatch.setattr(PositionDialog, "exec", mock_exec)
+    monkeypatch.setattr(PositionDialog, "open", mock_open)
 
     # Add position
     window._add_position()
@@ -65,8 +65,6 @@ def test_dialog_validates_positive_price(qtbot: QtBot) -> None:
 
     # Value should be clamped to minimum (0.01)
     assert dialog.price_input.value() == 0.01
-    # Validation should pass since it's > 0
-    assert dialog._validate_input()
 
 
 def test_dialog_accepts_positive_price(qtbot: QtBot) -> None:
@@ -81,11 +79,11 @@ def test_dialog_accepts_positive_price(qtbot: QtBot) -> None:
     )
     qtbot.addWidget(dialog)
 
-    # Set valid price
+    # Set valid price and accept
     dialog.price_input.setValue(30.00)
+    dialog.accept()
 
-    # Validation should pass
-    assert dialog._validate_input()
+    assert dialog.get_manual_price() == 30.00
 
 
 def test_dialog_get_manual_price(qtbot: QtBot) -> None:
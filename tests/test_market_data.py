@@ -4,9 +4,11 @@ Tests for data.market_data module.
 Tests market data fetching and caching functionality.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from typing import Any, Dict, Optional
+from unittest.mock import ANY, Mock, patch
 
 import pandas as pd
 import pytest
@@ -14,6 +16,7 @@ import pytest
 from data.market_data import (
     fetch_historical_data,
     fetch_price,
+    fetch_prices,
     get_cached_price,
     load_price_cache,
     save_price_cache,
@@ -21,6 +24,23 @@ from data.market_data import (
 )
 
 
+@dataclass
+class FakeTicker:
+    """Lightweight stand-in for yf.Ticker (avoids MagicMock overhead)."""
+
+    info: Dict[str, Any] = field(default_factory=dict)
+    _hist: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _last_period: Optional[str] = None
+
+    def history(self, period: str) -> pd.DataFrame:
+        self._last_period = period
+        return self._hist
+
+
+# Shared across parametrizations; built once instead of per test call
+_ONE_ROW_CLOSE_DF = pd.DataFrame({"Close": [28.5]})
+
+
 # Cache tests
 def test_load_price_cache_creates_directory_if_missing(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -147,22 +167,18 @@ def test_get_cached_price_returns_none_when_not_found(
 @patch("data.market_data.yf.Ticker")
 def test_fetch_price_returns_current_price(mock_ticker: Mock) -> None:
     """fetch_price() returns current price from Yahoo Finance."""
-    mock_instance = MagicMock()
-    mock_instance.info = {"currentPrice": 29.35}
-    mock_ticker.return_value = mock_instance
+    mock_ticker.return_value = FakeTicker(info={"currentPrice": 29.35})
 
     price = fetch_price("EWLD.PA", use_cache=False)
 
     assert price == 29.35
-    mock_ticker.assert_called_once_with("EWLD.PA")
+    mock_ticker.assert_called_once_with("EWLD.PA", session=ANY)
 
 
 @patch("data.market_data.yf.Ticker")
 def test_fetch_price_returns_regular_market_price(mock_ticker: Mock) -> None:
     """fetch_price() returns regularMarketPrice if currentPrice not available."""
-    mock_instance = MagicMock()
-    mock_instance.info = {"regularMarketPrice": 43.12}
-    mock_ticker.return_value = mock_instance
+    mock_ticker.return_value = FakeTicker(info={"regularMarketPrice": 43.12})
 
     price = fetch_price("PE500.PA", use_cache=False)
 
@@ -204,9 +220,7 @@ def test_fetch_price_returns_none_when_no_cache(mock_ticker: Mock) -> None:
 @patch("data.market_data.yf.Ticker")
 def test_fetch_price_returns_none_when_no_price_data(mock_ticker: Mock) -> None:
     """fetch_price() returns None when no price data available."""
-    mock_instance = MagicMock()
-    mock_instance.info = {}
-    mock_ticker.return_value = mock_instance
+    mock_ticker.return_value = FakeTicker(info={})
 
     price = fetch_price("EWLD.PA", use_cache=False)
 
@@ -217,7 +231,6 @@ def test_fetch_price_returns_none_when_no_price_data(mock_ticker: Mock) -> None:
 @patch("data.market_data.yf.Ticker")
 def test_fetch_historical_data_returns_dataframe(mock_ticker: Mock) -> None:
     """fetch_historical_data() returns DataFrame with OHLCV data."""
-    mock_instance = MagicMock()
     mock_df = pd.DataFrame(
         {
             "Open": [28.0, 28.5],
@@ -227,15 +240,15 @@ def test_fetch_historical_data_returns_dataframe(mock_ticker: Mock) -> None:
             "Volume": [1000, 1100],
         }
     )
-    mock_instance.history.return_value = mock_df
-    mock_ticker.return_value = mock_instance
+    fake = FakeTicker(_hist=mock_df)
+    mock_ticker.return_value = fake
 
     df = fetch_historical_data("EWLD.PA", period="1mo")
 
     assert not df.empty
     assert len(df) == 2
     assert "Close" in df.columns
-    mock_instance.history.assert_called_once_with(period="1mo")
+    assert fake._last_period == "1mo"
 
 
 @patch("data.market_data.yf.Ticker")
@@ -251,9 +264,7 @@ def test_fetch_historical_data_handles_error(mock_ticker: Mock) -> None:
 @patch("data.market_data.yf.Ticker")
 def test_fetch_historical_data_handles_empty_response(mock_ticker: Mock) -> None:
     """fetch_historical_data() returns empty DataFrame when no data available."""
-    mock_instance = MagicMock()
-    mock_instance.history.return_value = pd.DataFrame()
-    mock_ticker.return_value = mock_instance
+    mock_ticker.return_value = FakeTicker(_hist=pd.DataFrame())
 
     df = fetch_historical_data("EWLD.PA")
 
@@ -269,12 +280,66 @@ def test_fetch_historical_data_supports_different_periods(
     mock_ticker: Mock, period: str
 ) -> None:
     """fetch_historical_data() supports different time periods."""
-    mock_instance = MagicMock()
-    mock_df = pd.DataFrame({"Close": [28.5]})
-    mock_instance.history.return_value = mock_df
-    mock_ticker.return_value = mock_instance
+    fake = FakeTicker(_hist=_ONE_ROW_CLOSE_DF)
+    mock_ticker.return_value = fake
 
     df = fetch_historical_data("EWLD.PA", period=period)
 
     assert not df.empty
-    mock_instance.history.assert_called_once_with(period=period)
+    assert fake._last_period == period
+
+
+# fetch_prices (batch) tests
+@patch("data.market_data.yf.Ticker")
+def test_fetch_prices_returns_batch(mock_ticker: Mock) -> None:
+    """fetch_prices() returns a price for each fetchable ticker."""
+    infos = {
+        "EWLD.PA": {"currentPrice": 29.35},
+        "PE500.PA": {"regularMarketPrice": 43.12},
+    }
+    mock_ticker.side_effect = lambda ticker, session=None: FakeTicker(
+        info=infos[ticker]
+    )
+
+    prices = fetch_prices(["EWLD.PA", "PE500.PA"], use_cache=False)
+
+    assert prices == {"EWLD.PA": 29.35, "PE500.PA": 43.12}
+
+
+@patch("data.market_data.yf.Ticker")
+def test_fetch_prices_omits_failed_tickers(mock_ticker: Mock) -> None:
+    """fetch_prices() omits tickers whose fetch fails without cache."""
+    mock_ticker.side_effect = Exception("Network error")
+
+    prices = fetch_prices(["EWLD.PA"], use_cache=False)
+
+    assert prices == {}
+
+
+def test_fetch_prices_empty_list_skips_network() -> None:
+    """fetch_prices() returns an empty dict without touching the network."""
+    assert fetch_prices([]) == {}
+
+
+# In-memory TTL cache tests
+@patch("data.market_data.yf.Ticker")
+def test_fetch_price_served_from_memory_within_ttl(mock_ticker: Mock) -> None:
+    """fetch_price() answers repeat calls from memory without the network."""
+    mock_ticker.return_value = FakeTicker(info={"currentPrice": 29.35})
+
+    first = fetch_price("EWLD.PA", use_cache=True)
+    second = fetch_price("EWLD.PA", use_cache=True)
+
+    assert first == second == 29.35
+    mock_ticker.assert_called_once()
+
+
+@patch("data.market_data.yf.Ticker")
+def test_fetch_price_bypasses_memory_without_cache(mock_ticker: Mock) -> None:
+    """fetch_price(use_cache=False) always goes to the network."""
+    mock_ticker.return_value = FakeTicker(info={"currentPrice": 29.35})
+
+    fetch_price("EWLD.PA", use_cache=True)
+    fetch_price("EWLD.PA", use_cache=False)
+
+    assert mock_ticker.call_count == 2
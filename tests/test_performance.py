@@ -20,15 +20,21 @@ from analytics.performance import (
     calculate_returns,
     calculate_sharpe_ratio,
     calculate_total_invested,
+    calculate_value_and_pnl,
     calculate_volatility,
 )
 from data.portfolio import ETFPosition, Portfolio
 
+# Shared date indices (pd.date_range allocates a fresh DatetimeIndex per call)
+_DATES_5 = pd.date_range("2024-01-01", periods=5, freq="D")
+_DATES_3 = pd.date_range("2024-01-01", periods=3, freq="D")
+_DATES_2_FROM_2ND = pd.date_range("2024-01-02", periods=2, freq="D")
+
 
 # Fixtures
-@pytest.fixture
-def sample_portfolio() -> Portfolio:
-    """Create a sample portfolio with 3 positions."""
+@pytest.fixture(scope="session")
+def _sample_portfolio_frozen() -> Portfolio:
+    """Build the shared sample portfolio once per session."""
     positions = [
         ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
         ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
@@ -37,6 +43,12 @@ def sample_portfolio() -> Portfolio:
     return Portfolio(positions)
 
 
+@pytest.fixture
+def sample_portfolio(_sample_portfolio_frozen: Portfolio) -> Portfolio:
+    """Shared sample portfolio with 3 positions (read-only by convention)."""
+    return _sample_portfolio_frozen
+
+
 @pytest.fixture
 def sample_prices() -> dict[str, float]:
     """Sample current prices for portfolio positions."""
@@ -50,15 +62,15 @@ def sample_prices() -> dict[str, float]:
 @pytest.fixture
 def sample_historical_data() -> dict[str, pd.DataFrame]:
     """Sample historical price data for 5 days."""
-    dates = pd.date_range("2024-01-01", periods=5, freq="D")
-
     return {
-        "EWLD.PA": pd.DataFrame({"Close": [28.0, 28.2, 28.5, 28.8, 29.0]}, index=dates),
+        "EWLD.PA": pd.DataFrame(
+            {"Close": [28.0, 28.2, 28.5, 28.8, 29.0]}, index=_DATES_5
+        ),
         "PE500.PA": pd.DataFrame(
-            {"Close": [42.0, 42.3, 42.1, 42.5, 42.8]}, index=dates
+            {"Close": [42.0, 42.3, 42.1, 42.5, 42.8]}, index=_DATES_5
         ),
         "PAEEM.PA": pd.DataFrame(
-            {"Close": [18.0, 18.2, 17.9, 18.1, 18.3]}, index=dates
+            {"Close": [18.0, 18.2, 17.9, 18.1, 18.3]}, index=_DATES_5
         ),
     }
 
@@ -158,6 +170,26 @@ def test_calculate_pnl_with_empty_portfolio() -> None:
     assert pnl == 0.0
 
 
+# Fused value + P&L tests
+def test_calculate_value_and_pnl_matches_split_functions(
+    sample_portfolio: Portfolio, sample_prices: dict[str, float]
+) -> None:
+    """calculate_value_and_pnl() agrees with the two split functions."""
+    total_value, pnl = calculate_value_and_pnl(sample_portfolio, sample_prices)
+
+    assert total_value == pytest.approx(
+        calculate_portfolio_value(sample_portfolio, sample_prices), rel=1e-9
+    )
+    assert pnl == pytest.approx(
+        calculate_pnl(sample_portfolio, sample_prices), rel=1e-9
+    )
+
+
+def test_calculate_value_and_pnl_with_empty_portfolio() -> None:
+    """calculate_value_and_pnl() returns (0.0, 0.0) for empty portfolio."""
+    assert calculate_value_and_pnl(Portfolio(), {"EWLD.PA": 29.35}) == (0.0, 0.0)
+
+
 # Position values tests
 def test_calculate_position_values_returns_correct_dict(
     sample_portfolio: Portfolio, sample_prices: dict[str, float]
@@ -261,18 +293,9 @@ def test_calculate_returns_with_misaligned_dates(sample_portfolio: Portfolio) ->
     """calculate_returns() handles misaligned dates across ETFs."""
     # Different date ranges for each ETF
     historical_data = {
-        "EWLD.PA": pd.DataFrame(
-            {"Close": [28.0, 28.5, 29.0]},
-            index=pd.date_range("2024-01-01", periods=3, freq="D"),
-        ),
-        "PE500.PA": pd.DataFrame(
-            {"Close": [42.0, 42.5]},
-            index=pd.date_range("2024-01-02", periods=2, freq="D"),
-        ),
-        "PAEEM.PA": pd.DataFrame(
-            {"Close": [18.0, 18.5]},
-            index=pd.date_range("2024-01-01", periods=2, freq="D"),
-        ),
+        "EWLD.PA": pd.DataFrame({"Close": [28.0, 28.5, 29.0]}, index=_DATES_3),
+        "PE500.PA": pd.DataFrame({"Close": [42.0, 42.5]}, index=_DATES_2_FROM_2ND),
+        "PAEEM.PA": pd.DataFrame({"Close": [18.0, 18.5]}, index=_DATES_3[:2]),
     }
 
     returns = calculate_returns(sample_portfolio, historical_data, period="daily")
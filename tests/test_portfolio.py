@@ -7,66 +7,84 @@ Tests ETF position management and portfolio CRUD operations.
 import csv
 from datetime import date
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from data.portfolio import ETFPosition, Portfolio
 
 
-# ETFPosition tests
-def test_etfposition_creation() -> None:
-    """ETFPosition can be created with all required fields."""
-    position = ETFPosition(
-        ticker="EWLD.PA",
-        name="Amundi MSCI World UCITS ETF",
-        quantity=100.0,
-        buy_price=28.50,
-        buy_date=date(2024, 1, 15),
-    )
-
-    assert position.ticker == "EWLD.PA"
-    assert position.name == "Amundi MSCI World UCITS ETF"
-    assert position.quantity == 100.0
-    assert position.buy_price == 28.50
-    assert position.buy_date == date(2024, 1, 15)
-
-
-def test_etfposition_to_dict() -> None:
-    """ETFPosition.to_dict() returns correct dictionary."""
-    position = ETFPosition(
-        ticker="PE500.PA",
-        name="Lyxor S&P 500",
-        quantity=50.0,
-        buy_price=42.30,
-        buy_date=date(2024, 2, 10),
-    )
-
-    result = position.to_dict()
-
-    assert result["ticker"] == "PE500.PA"
-    assert result["name"] == "Lyxor S&P 500"
-    assert result["quantity"] == 50.0
-    assert result["buy_price"] == 42.30
-    assert result["buy_date"] == "2024-02-10"
-
-
-def test_etfposition_from_dict() -> None:
-    """ETFPosition.from_dict() reconstructs object correctly."""
-    data = {
-        "ticker": "PAEEM.PA",
-        "name": "Lyxor Emergents",
-        "quantity": 75.0,
-        "buy_price": 18.25,
-        "buy_date": "2024-03-05",
-    }
+# ETFPosition tests: one construction/to_dict/from_dict roundtrip table
+@pytest.mark.parametrize(
+    "kwargs,expected_dict",
+    [
+        (
+            dict(
+                ticker="EWLD.PA",
+                name="Amundi MSCI World UCITS ETF",
+                quantity=100.0,
+                buy_price=28.50,
+                buy_date=date(2024, 1, 15),
+            ),
+            {
+                "ticker": "EWLD.PA",
+                "name": "Amundi MSCI World UCITS ETF",
+                "quantity": 100.0,
+                "buy_price": 28.50,
+                "buy_date": "2024-01-15",
+                "manual_price": None,
+            },
+        ),
+        (
+            dict(
+                ticker="PE500.PA",
+                name="Lyxor S&P 500",
+                quantity=50.0,
+                buy_price=42.30,
+                buy_date=date(2024, 2, 10),
+                manual_price=45.00,
+            ),
+            {
+                "ticker": "PE500.PA",
+                "name": "Lyxor S&P 500",
+                "quantity": 50.0,
+                "buy_price": 42.30,
+                "buy_date": "2024-02-10",
+                "manual_price": 45.00,
+            },
+        ),
+        (
+            dict(
+                ticker="PAEEM.PA",
+                name="Lyxor Emergents",
+                quantity=75.0,
+                buy_price=18.25,
+                buy_date=date(2024, 3, 5),
+                manual_price=20.00,
+            ),
+            {
+                "ticker": "PAEEM.PA",
+                "name": "Lyxor Emergents",
+                "quantity": 75.0,
+                "buy_price": 18.25,
+                "buy_date": "2024-03-05",
+                "manual_price": 20.00,
+            },
+        ),
+    ],
+)
+def test_etfposition_roundtrip(
+    kwargs: dict[str, Any], expected_dict: dict[str, Any]
+) -> None:
+    """ETFPosition fields, to_dict(), and from_dict() agree on one table."""
+    position = ETFPosition(**kwargs)
 
-    position = ETFPosition.from_dict(data)
+    for field_name, value in kwargs.items():
+        assert getattr(position, field_name) == value
+    assert position.manual_price == kwargs.get("manual_price")
 
-    assert position.ticker == "PAEEM.PA"
-    assert position.name == "Lyxor Emergents"
-    assert position.quantity == 75.0
-    assert position.buy_price == 18.25
-    assert position.buy_date == date(2024, 3, 5)
+    assert position.to_dict() == expected_dict
+    assert ETFPosition.from_dict(expected_dict) == position
 
 
 # Portfolio CRUD tests
@@ -77,16 +95,11 @@ def test_portfolio_empty_initialization() -> None:
     assert len(portfolio.positions) == 0
 
 
-def test_portfolio_initialization_with_positions() -> None:
+def test_portfolio_initialization_with_positions(
+    two_position_portfolio: Portfolio,
+) -> None:
     """Portfolio can be initialized with existing positions."""
-    positions = [
-        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
-        ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
-    ]
-
-    portfolio = Portfolio(positions)
-
-    assert len(portfolio.positions) == 2
+    assert len(two_position_portfolio.positions) == 2
 
 
 def test_portfolio_add_position() -> None:
@@ -154,6 +167,25 @@ def test_portfolio_update_nonexistent_raises_error() -> None:
         portfolio.update_position("NONEXISTENT.PA", position)
 
 
+def test_portfolio_update_rename_onto_existing_ticker_raises_error() -> None:
+    """Renaming a position onto an existing ticker raises ValueError."""
+    positions = [
+        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
+        ETFPosition("PE500.PA", "Amundi S&P 500", 50.0, 35.00, date(2024, 2, 1)),
+    ]
+    portfolio = Portfolio(positions)
+
+    renamed = ETFPosition("PE500.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15))
+
+    with pytest.raises(ValueError, match="already exists"):
+        portfolio.update_position("EWLD.PA", renamed)
+
+    # Both positions survive untouched
+    assert len(portfolio.positions) == 2
+    assert portfolio.get_position("EWLD.PA") is not None
+    assert portfolio.get_position("PE500.PA") is not None
+
+
 def test_portfolio_get_position() -> None:
     """Portfolio.get_position() returns correct position."""
     position = ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15))
@@ -175,15 +207,9 @@ def test_portfolio_get_nonexistent_position() -> None:
     assert result is None
 
 
-def test_portfolio_get_all_positions() -> None:
+def test_portfolio_get_all_positions(two_position_portfolio: Portfolio) -> None:
     """Portfolio.get_all_positions() returns all positions."""
-    positions = [
-        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
-        ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
-    ]
-    portfolio = Portfolio(positions)
-
-    result = portfolio.get_all_positions()
+    result = two_position_portfolio.get_all_positions()
 
     assert len(result) == 2
     assert result[0].ticker == "EWLD.PA"
@@ -191,16 +217,12 @@ def test_portfolio_get_all_positions() -> None:
 
 
 # JSON persistence tests
-def test_save_and_load_json_preserves_data(tmp_path: Path) -> None:
+def test_save_and_load_json_preserves_data(
+    tmp_path: Path, two_position_portfolio: Portfolio
+) -> None:
     """Portfolio saved to JSON and loaded back is identical."""
-    positions = [
-        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
-        ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
-    ]
-    portfolio = Portfolio(positions)
-
     json_file = tmp_path / "portfolio.json"
-    portfolio.save_to_json(json_file)
+    two_position_portfolio.save_to_json(json_file)
 
     loaded_portfolio = Portfolio.load_from_json(json_file)
 
@@ -210,6 +232,21 @@ def test_save_and_load_json_preserves_data(tmp_path: Path) -> None:
     assert loaded_portfolio.positions[1].ticker == "PE500.PA"
 
 
+def test_to_json_bytes_memoized_until_mutation(
+    two_position_portfolio: Portfolio,
+) -> None:
+    """to_json_bytes() reuses its buffer until positions change."""
+    first = two_position_portfolio.to_json_bytes()
+
+    assert two_position_portfolio.to_json_bytes() is first
+
+    two_position_portfolio.remove_position("PE500.PA")
+    second = two_position_portfolio.to_json_bytes()
+
+    assert second is not first
+    assert b"PE500.PA" not in second
+
+
 def test_load_json_with_missing_file_raises_error(tmp_path: Path) -> None:
     """Loading missing JSON file raises FileNotFoundError."""
     json_file = tmp_path / "nonexistent.json"
@@ -219,16 +256,12 @@ def test_load_json_with_missing_file_raises_error(tmp_path: Path) -> None:
 
 
 # CSV import/export tests
-def test_export_csv_creates_valid_file(tmp_path: Path) -> None:
+def test_export_csv_creates_valid_file(
+    tmp_path: Path, two_position_portfolio: Portfolio
+) -> None:
     """export_to_csv() creates CSV with correct format."""
-    positions = [
-        ETFPosition("EWLD.PA", "Amundi World", 100.0, 28.50, date(2024, 1, 15)),
-        ETFPosition("PE500.PA", "Lyxor S&P 500", 50.0, 42.30, date(2024, 2, 10)),
-    ]
-    portfolio = Portfolio(positions)
-
     csv_file = tmp_path / "portfolio.csv"
-    portfolio.export_to_csv(csv_file)
+    two_position_portfolio.export_to_csv(csv_file)
 
     assert csv_file.exists()
 
@@ -316,80 +349,8 @@ def test_import_actual_demo_portfolio() -> None:
 
 
 # Manual Price Override tests (Phase 1)
-def test_etfposition_with_manual_price() -> None:
-    """ETFPosition can be created with manual price override."""
-    position = ETFPosition(
-        ticker="EWLD.PA",
-        name="Amundi World",
-        quantity=100.0,
-        buy_price=28.50,
-        buy_date=date(2024, 1, 15),
-        manual_price=30.00,
-    )
-
-    assert position.manual_price == 30.00
-
-
-def test_etfposition_without_manual_price() -> None:
-    """ETFPosition manual_price defaults to None."""
-    position = ETFPosition(
-        ticker="EWLD.PA",
-        name="Amundi World",
-        quantity=100.0,
-        buy_price=28.50,
-        buy_date=date(2024, 1, 15),
-    )
-
-    assert position.manual_price is None
-
-
-def test_etfposition_to_dict_with_manual_price() -> None:
-    """ETFPosition.to_dict() includes manual_price when set."""
-    position = ETFPosition(
-        ticker="PE500.PA",
-        name="Lyxor S&P 500",
-        quantity=50.0,
-        buy_price=42.30,
-        buy_date=date(2024, 2, 10),
-        manual_price=45.00,
-    )
-
-    result = position.to_dict()
-
-    assert result["manual_price"] == 45.00
-
-
-def test_etfposition_to_dict_without_manual_price() -> None:
-    """ETFPosition.to_dict() includes manual_price as None when not set."""
-    position = ETFPosition(
-        ticker="PE500.PA",
-        name="Lyxor S&P 500",
-        quantity=50.0,
-        buy_price=42.30,
-        buy_date=date(2024, 2, 10),
-    )
-
-    result = position.to_dict()
-
-    assert result["manual_price"] is None
-
-
-def test_etfposition_from_dict_with_manual_price() -> None:
-    """ETFPosition.from_dict() reconstructs manual_price correctly."""
-    data = {
-        "ticker": "PAEEM.PA",
-        "name": "Lyxor Emergents",
-        "quantity": 75.0,
-        "buy_price": 18.25,
-        "buy_date": "2024-03-05",
-        "manual_price": 20.00,
-    }
-
-    position = ETFPosition.from_dict(data)
-
-    assert position.manual_price == 20.00
-
-
+# (construction/to_dict/from_dict manual-price cases live in the
+# parametrized roundtrip table above)
 def test_etfposition_from_dict_backward_compatible() -> None:
     """ETFPosition.from_dict() handles missing manual_price (backward compatibility)."""
     data = {
@@ -7,6 +7,7 @@ and fallback to defaults.
 
 import json
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -217,24 +218,17 @@ def test_load_settings_with_type_error_uses_defaults(
 def test_save_settings_with_permission_error_raises(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """save_settings() raises PermissionError when directory not writable."""
+    """save_settings() raises PermissionError when target is not writable."""
     config_dir = tmp_path / "readonly_config"
     config_file = config_dir / "config.json"
 
     monkeypatch.setattr("config.settings.CONFIG_DIR", config_dir)
     monkeypatch.setattr("config.settings.CONFIG_FILE", config_file)
 
-    # Create read-only directory
-    config_dir.mkdir(parents=True, exist_ok=True)
-    import os
-
-    os.chmod(config_dir, 0o444)
-
     settings = get_default_settings()
 
-    try:
+    # Mock the write instead of chmod-ing a real directory: faster, and
+    # works on platforms (and as root) where 0o444 isn't enforced
+    with mock.patch("config.settings.open", side_effect=PermissionError, create=True):
         with pytest.raises((PermissionError, OSError)):
             save_settings(settings)
-    finally:
-        # Restore write permissions for cleanup
-        os.chmod(config_dir, 0o755)
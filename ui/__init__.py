@@ -10,4 +10,32 @@ This module contains all user interface components including:
 - Dashboard components
 """
 
+from typing import List
+
 __version__ = "1.0.0"
+
+# PEP 562 lazy exports: importing ui stays free of the PyQt6 import cost
+# until a GUI symbol is actually accessed.
+_LAZY_EXPORTS = {
+    "MainWindow": "ui.main_window",
+    "PortfolioTableWidget": "ui.portfolio_table",
+    "DashboardWidget": "ui.dashboard",
+    "ChartWidget": "ui.chart_widget",
+    "PositionDialog": "ui.position_dialog",
+    "SettingsDialog": "ui.settings_dialog",
+    "ManualPriceDialog": "ui.manual_price_dialog",
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
@@ -1,18 +1,19 @@
 """
-Chart widget for displaying Plotly charts.
+Chart widget for displaying allocation charts.
 
-Provides a widget for displaying interactive Plotly charts using QWebEngineView.
+Provides a widget that renders pie and bar charts natively with matplotlib.
 """
 
 import logging
+import math
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QHBoxLayout,
@@ -25,9 +26,101 @@ from PyQt6.QtWidgets import (
 
 from config.settings import ChartPreferences
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 logger = logging.getLogger(__name__)
 
 
+class _PngExportTask(QRunnable):
+    """Renders a figure to PNG on a worker thread (savefig re-renders
+    independently of the canvas, so the GUI thread stays free).
+
+    Callers must hand over a detached snapshot of the figure, never the
+    live one: display updates and debounced-resize redraws keep mutating
+    and drawing the on-screen figure while this task renders, and Agg is
+    not safe against concurrent draws of the same Figure."""
+
+    class Signals(QObject):
+        finished = pyqtSignal(str)
+        failed = pyqtSignal(str)
+
+    def __init__(self, figure: "Figure", path: str, dpi: float, tight: bool) -> None:
+        super().__init__()
+        self._figure = figure
+        self._path = path
+        self._dpi = dpi
+        self._tight = tight
+        self.signals = _PngExportTask.Signals()
+
+    def run(self) -> None:
+        try:
+            if self._tight:
+                self._figure.savefig(self._path, dpi=self._dpi, bbox_inches="tight")
+            else:
+                self._figure.savefig(self._path, dpi=self._dpi)
+        except Exception as e:  # pragma: no cover - depends on filesystem
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self._path)
+
+
+@lru_cache(maxsize=1)
+def _canvas_class() -> type:
+    """Build (once) the canvas class; defined lazily to keep matplotlib off
+    the module import path."""
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    from PyQt6.QtGui import QResizeEvent
+
+    class DebouncedResizeCanvas(FigureCanvasQTAgg):  # type: ignore[misc]
+        """Agg canvas that coalesces resize storms.
+
+        Every size change makes Agg reallocate the RGBA render buffer on the
+        next draw; during an interactive window resize that happens once per
+        intermediate size. The first resize applies immediately (so show and
+        layout work normally) and the rest of a burst is applied once, 50 ms
+        after it ends.
+        """
+
+        def __init__(self, figure: "Figure") -> None:
+            super().__init__(figure)
+            self._pending_resize: Optional[QResizeEvent] = None
+            self._resize_timer = QTimer(self)
+            self._resize_timer.setSingleShot(True)
+            self._resize_timer.setInterval(50)
+            self._resize_timer.timeout.connect(self._apply_pending_resize)
+
+        def resizeEvent(self, event: QResizeEvent) -> None:
+            if not self._resize_timer.isActive():
+                super().resizeEvent(event)
+                self._resize_timer.start()
+                return
+            # Mid-burst: keep Qt's geometry bookkeeping but defer the
+            # figure/renderer buffer reallocation to the trailing edge
+            self._pending_resize = QResizeEvent(event.size(), event.oldSize())
+            QWidget.resizeEvent(self, event)
+            self._resize_timer.start()
+
+        def _apply_pending_resize(self) -> None:
+            if self._pending_resize is not None:
+                event = self._pending_resize
+                self._pending_resize = None
+                super().resizeEvent(event)
+
+    return DebouncedResizeCanvas
+
+
+@lru_cache(maxsize=32)
+def _set3_colors(n: int) -> "object":
+    """RGBA colors from the Set3 colormap, cached per position count."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    # Colormap __call__ interpolates per entry; portfolios keep the same
+    # position count for long stretches, so cache the resulting array
+    return plt.cm.Set3(np.linspace(0, 1, max(n, 1)))  # type: ignore[attr-defined]
+
+
 class ChartWidget(QWidget):
     """Widget for displaying matplotlib charts."""
 
@@ -48,8 +141,7 @@ class ChartWidget(QWidget):
 
         Example:
             >>> widget = ChartWidget()
-            >>> fig = go.Figure()
-            >>> widget.display_chart(fig)
+            >>> widget.display_chart("Allocation Pie", ["VT"], [100.0])
         """
         super().__init__(parent)
         self.preferences = preferences or ChartPreferences(
@@ -58,10 +150,19 @@ class ChartWidget(QWidget):
             show_grid=True,
             show_legend=True,
         )
-        self.current_figure: Optional[Figure] = None
+        self.current_figure: Optional["Figure"] = None
         self.current_tickers: List[str] = []
         self.current_percentages: List[float] = []
         self.current_values: Dict[str, float] = {}  # For bar chart
+        # Key of the chart currently on the canvas; lets display_chart skip
+        # rebuilding artists when asked to show exactly what is shown.
+        self._displayed_key: Optional[tuple] = None
+        # Live bar-chart artists, reused by the in-place update path
+        self._bars: Optional[object] = None
+        self._bar_labels: List[object] = []
+        # Live pie-chart artists, ditto
+        self._wedges: Optional[list] = None
+        self._pie_texts: List[object] = []
         self._setup_ui()
         logger.debug("Chart widget initialized")
 
@@ -85,7 +186,11 @@ class ChartWidget(QWidget):
 
         controls_layout.addStretch()
 
-        # Export buttons
+        # Export options and buttons
+        self.highres_checkbox = QCheckBox("High-res export")
+        self.highres_checkbox.setToolTip("Export PNG at 300 dpi with tight bounding box")
+        controls_layout.addWidget(self.highres_checkbox)
+
         self.export_png_button = QPushButton("Export PNG")
         self.export_png_button.clicked.connect(self._export_png)
         controls_layout.addWidget(self.export_png_button)
@@ -96,12 +201,35 @@ class ChartWidget(QWidget):
 
         layout.addLayout(controls_layout)
 
-        # Matplotlib canvas for native chart display
+        # Matplotlib canvas for native chart display. Importing matplotlib
+        # here instead of at module top keeps it off the import path of code
+        # that never instantiates the widget.
+        from matplotlib.figure import Figure
+
         self.figure = Figure(figsize=(8, 6))
-        self.canvas = FigureCanvasQTAgg(self.figure)
+        # One persistent Axes for all chart types: clearing it is much
+        # cheaper than figure.clear() + add_subplot, which would rebuild the
+        # spine/tick machinery on every render
+        self._ax = self.figure.add_subplot(111)
+        self._ax.set_axis_off()
+        # Fixed margins sized for the two known chart layouts; tight_layout
+        # would re-measure them with a trial render on every display
+        self.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.15)
+        self.canvas = _canvas_class()(self.figure)
         self.canvas.setMinimumHeight(400)
         layout.addWidget(self.canvas)
 
+        # Native Qt label for the empty state: showing static text does not
+        # warrant a matplotlib render pass
+        self.empty_label = QLabel(
+            "No data to display\n\nAdd positions or refresh prices to view charts"
+        )
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("color: #666; font-size: 12pt;")
+        self.empty_label.setMinimumHeight(400)
+        self.empty_label.hide()
+        layout.addWidget(self.empty_label)
+
         self.setLayout(layout)
 
         # Initially disable export buttons
@@ -146,8 +274,59 @@ class ChartWidget(QWidget):
         if values:
             self.current_values = values
 
-        # Clear previous figure
-        self.figure.clear()
+        if not self.canvas.isVisible() and self.empty_label.isVisible():
+            self.empty_label.hide()
+            self.canvas.show()
+
+        # Artist construction dominates display cost; if the requested chart
+        # is already on the canvas, there is nothing to rebuild.
+        key = (
+            chart_type,
+            tuple(tickers),
+            tuple(percentages or ()),
+            tuple(sorted((values or {}).items())),
+        )
+        if key == self._displayed_key:
+            self.export_png_button.setEnabled(True)
+            logger.debug("Chart unchanged, skipping re-render: %s", chart_type)
+            return
+
+        # Same bar chart, new values: mutate the existing bars and labels
+        # instead of clearing the figure and rebuilding every artist.
+        if (
+            chart_type == "Allocation Bar"
+            and self._bars is not None
+            and self._displayed_key is not None
+            and self._displayed_key[:2] == ("Allocation Bar", tuple(tickers))
+        ):
+            self._update_bar_chart(tickers, values or {})
+            self._displayed_key = key
+            self.canvas.draw_idle()
+            self.export_png_button.setEnabled(True)
+            logger.debug("Bar chart updated in place with %d values", len(tickers))
+            return
+
+        # Same pie chart, new percentages: rotate the existing wedges
+        if (
+            chart_type == "Allocation Pie"
+            and self._wedges is not None
+            and self._displayed_key is not None
+            and self._displayed_key[:2] == ("Allocation Pie", tuple(tickers))
+            and len(self._wedges) == len(tickers)
+        ):
+            self._update_pie_chart(tickers, percentages or [])
+            self._displayed_key = key
+            self.canvas.draw_idle()
+            self.export_png_button.setEnabled(True)
+            logger.debug("Pie chart updated in place with %d wedges", len(tickers))
+            return
+
+        # Reset the persistent Axes for the new chart
+        self._ax.clear()
+        self._bars = None
+        self._bar_labels = []
+        self._wedges = None
+        self._pie_texts = []
 
         if chart_type == "Allocation Pie":
             self._render_pie_chart(tickers, percentages or [])
@@ -155,13 +334,17 @@ class ChartWidget(QWidget):
             self._render_bar_chart(tickers, values or {})
         else:
             logger.warning("Unknown chart type: %s", chart_type)
+            self._displayed_key = None
             return
+        self._displayed_key = key
 
-        # Adjust layout to prevent label cutoff
-        self.figure.tight_layout()
+        # Fixed margins cover both layouts; only many rotated bar labels can
+        # overflow them and need a measured layout pass
+        if chart_type == "Allocation Bar" and len(tickers) > 5:
+            self.figure.tight_layout()
 
-        # Redraw canvas
-        self.canvas.draw()
+        # Queue a redraw; Qt coalesces bursts into a single render
+        self.canvas.draw_idle()
 
         # Enable export buttons
         self.export_png_button.setEnabled(True)
@@ -179,22 +362,23 @@ class ChartWidget(QWidget):
             tickers: List of ticker symbols.
             percentages: List of allocation percentages (0-100).
         """
-        ax = self.figure.add_subplot(111)
-        colors = plt.cm.Set3(range(len(tickers)))  # type: ignore[attr-defined]
+        ax = self._ax
+        colors = _set3_colors(len(tickers))
 
-        wedges, texts, autotexts = ax.pie(  # type: ignore[misc]
+        # Precomputed "ticker + percent" labels replace the autopct callback,
+        # which matplotlib would otherwise invoke once per wedge (plus one
+        # Text artist and one restyle pass per wedge).
+        labels = [f"{t}\n{p:.1f}%" for t, p in zip(tickers, percentages)]
+
+        wedges, texts = ax.pie(  # type: ignore[misc]
             percentages,
-            labels=tickers,
-            autopct="%1.1f%%",
+            labels=labels,
             startangle=90,
             colors=colors,
             textprops={"fontsize": 10},
         )
-
-        # Make percentage text bold and white
-        for autotext in autotexts:
-            autotext.set_color("white")
-            autotext.set_fontweight("bold")
+        self._wedges = list(wedges)
+        self._pie_texts = list(texts)
 
         ax.set_title("Portfolio Allocation", fontsize=14, fontweight="bold", pad=20)
 
@@ -209,7 +393,7 @@ class ChartWidget(QWidget):
             tickers: List of ticker symbols.
             values: Dict mapping ticker to value (EUR).
         """
-        ax = self.figure.add_subplot(111)
+        ax = self._ax
 
         # Extract values in same order as tickers
         bar_values = [values.get(ticker, 0.0) for ticker in tickers]
@@ -218,30 +402,82 @@ class ChartWidget(QWidget):
         bars = ax.bar(
             tickers,
             bar_values,
-            color=plt.cm.Set3(range(len(tickers))),  # type: ignore[attr-defined]
+            color=_set3_colors(len(tickers)),
             edgecolor="black",
         )
 
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"€{height:,.0f}",
-                ha="center",
-                va="bottom",
-                fontsize=9,
-            )
+        # One batched bar_label call creates and positions all value labels;
+        # the artists are kept so value-only updates can mutate them in place
+        labels = [f"€{v:,.0f}" for v in bar_values]
+        self._bar_labels = list(
+            ax.bar_label(bars, labels=labels, padding=3, fontsize=9)
+        )
+        self._bars = bars
 
         ax.set_title("Position Values", fontsize=14, fontweight="bold", pad=20)
         ax.set_xlabel("Ticker", fontsize=11)
         ax.set_ylabel("Value (EUR)", fontsize=11)
         ax.grid(axis="y", alpha=0.3)
 
-        # Rotate x-axis labels if many tickers
+        # Rotate x-axis labels if many tickers. Mutating the existing Text
+        # artists avoids set_xticklabels, which re-runs tick generation for
+        # labels ax.bar() already set.
         if len(tickers) > 5:
-            ax.set_xticklabels(tickers, rotation=45, ha="right")
+            for label in ax.get_xticklabels():
+                label.set_rotation(45)
+                label.set_horizontalalignment("right")
+
+    def _update_bar_chart(self, tickers: List[str], values: Dict[str, float]) -> None:
+        """
+        Update an existing bar chart in place with new values.
+
+        Mutates the bar and label artists created by _render_bar_chart
+        instead of rebuilding them; tickers must match the rendered chart.
+
+        Args:
+            tickers: List of ticker symbols (same order as rendered).
+            values: Dict mapping ticker to value (EUR).
+        """
+        assert self._bars is not None
+        ax = self._bars[0].axes  # type: ignore[index]
+        for ticker, bar, label in zip(tickers, self._bars, self._bar_labels):  # type: ignore[arg-type]
+            height = values.get(ticker, 0.0)
+            bar.set_height(height)
+            # bar_label artists are Annotations anchored at the bar top
+            label.xy = (label.xy[0], height)
+            label.set_text(f"€{height:,.0f}")
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+
+    def _update_pie_chart(self, tickers: List[str], percentages: List[float]) -> None:
+        """
+        Update an existing pie chart in place with new percentages.
+
+        Mutates the wedge angles and label texts created by
+        _render_pie_chart instead of rebuilding them; tickers must match the
+        rendered chart.
+
+        Args:
+            tickers: List of ticker symbols (same order as rendered).
+            percentages: List of allocation percentages (0-100).
+        """
+        assert self._wedges is not None
+        total = sum(percentages) or 1.0
+        # Matches ax.pie: counterclockwise from startangle=90
+        theta = 90.0
+        for ticker, pct, wedge, text in zip(
+            tickers, percentages, self._wedges, self._pie_texts
+        ):
+            span = 360.0 * pct / total
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            # Labels sit at labeldistance (default 1.1) along the mid-angle
+            mid = math.radians(theta + span / 2.0)
+            x = 1.1 * math.cos(mid)
+            text.set_position((x, 1.1 * math.sin(mid)))
+            text.set_horizontalalignment("left" if x > 0 else "right")
+            text.set_text(f"{ticker}\n{pct:.1f}%")
+            theta += span
 
     def _export_png(self) -> None:
         """Export current chart to PNG file."""
@@ -254,17 +490,41 @@ class ChartWidget(QWidget):
         )
 
         if file_path:
-            try:
-                self.figure.savefig(file_path, dpi=300, bbox_inches="tight")
-                logger.info("Chart exported to PNG: %s", file_path)
-                QMessageBox.information(
-                    self, "Export Successful", f"Chart saved to:\n{file_path}"
-                )
-            except Exception as e:
-                logger.error("Error exporting PNG: %s", e)
-                QMessageBox.critical(
-                    self, "Export Error", f"Could not export chart:\n{e}"
-                )
+            # Native dpi by default: 300 dpi + tight bbox forces two full
+            # render passes (one to measure, one to draw) for ~4x the
+            # pixels, which the simple pie/bar outputs rarely need.
+            # Rendering runs on the global thread pool so the event loop
+            # stays responsive; the button is disabled until it completes.
+            # The worker gets a pickled snapshot, not the live figure:
+            # chart switches and resize redraws may draw the on-screen
+            # figure while the export is still rendering. (Pickling drops
+            # the Qt canvas; savefig attaches a fresh Agg one.)
+            snapshot = pickle.loads(pickle.dumps(self.figure))
+            highres = self.highres_checkbox.isChecked()
+            task = _PngExportTask(
+                snapshot,
+                file_path,
+                300 if highres else self.figure.get_dpi(),
+                tight=highres,
+            )
+            task.signals.finished.connect(self._on_export_finished)
+            task.signals.failed.connect(self._on_export_failed)
+            self.export_png_button.setEnabled(False)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_export_finished(self, file_path: str) -> None:
+        """Report a completed background PNG export."""
+        self.export_png_button.setEnabled(True)
+        logger.info("Chart exported to PNG: %s", file_path)
+        QMessageBox.information(
+            self, "Export Successful", f"Chart saved to:\n{file_path}"
+        )
+
+    def _on_export_failed(self, error: str) -> None:
+        """Report a failed background PNG export."""
+        self.export_png_button.setEnabled(True)
+        logger.error("Error exporting PNG: %s", error)
+        QMessageBox.critical(self, "Export Error", f"Could not export chart:\n{error}")
 
     def _export_html(self) -> None:
         """Export current chart to HTML file (not supported with matplotlib)."""
@@ -277,8 +537,14 @@ class ChartWidget(QWidget):
 
     def clear_chart(self) -> None:
         """Clear the current chart display."""
-        self.figure.clear()
-        self.canvas.draw()
+        self._ax.clear()
+        self._ax.set_axis_off()
+        self.canvas.draw_idle()
+        self._displayed_key = None
+        self._bars = None
+        self._bar_labels = []
+        self._wedges = None
+        self._pie_texts = []
         self.current_tickers = []
         self.current_percentages = []
         self.export_png_button.setEnabled(False)
@@ -287,24 +553,18 @@ class ChartWidget(QWidget):
 
     def show_empty_state(self) -> None:
         """Show empty state message when no data is available."""
-        self.figure.clear()
-
-        # Add centered text message
-        ax = self.figure.add_subplot(111)
-        ax.text(
-            0.5,
-            0.5,
-            "No data to display\n\nAdd positions or refresh prices to view charts",
-            horizontalalignment="center",
-            verticalalignment="center",
-            transform=ax.transAxes,
-            fontsize=12,
-            color="#666",
-        )
-        ax.axis("off")
-
-        self.canvas.draw()
-
+        # Static text needs no Agg render: swap the canvas for a QLabel and
+        # let Qt paint it natively
+        self._ax.clear()
+        self._ax.set_axis_off()
+        self._bars = None
+        self._bar_labels = []
+        self._wedges = None
+        self._pie_texts = []
+        self.canvas.hide()
+        self.empty_label.show()
+
+        self._displayed_key = None
         self.current_tickers = []
         self.current_percentages = []
         self.export_png_button.setEnabled(False)
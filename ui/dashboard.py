@@ -7,7 +7,7 @@ Displays key performance indicators, risk metrics, and summary statistics.
 import logging
 from typing import Dict, Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QGridLayout,
     QGroupBox,
@@ -16,11 +16,28 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from analytics.performance import calculate_pnl, calculate_portfolio_value
+from analytics.performance import calculate_value_and_pnl
 from data.portfolio import Portfolio
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt P&L label styles: swapping constants avoids re-parsing a freshly
+# formatted stylesheet on every refresh
+_STYLE_PNL_POS = "font-size: 18px; color: #2ca02c;"  # green
+_STYLE_PNL_NEG = "font-size: 18px; color: #d62728;"  # red
+
+# Prebound formatters for the KPI labels: the format spec is parsed once
+# instead of per refresh
+_FMT_EUR = "€{:,.2f}".format
+_FMT_EUR_SIGN = "€{:+,.2f}".format
+_FMT_PCT = "{:+.2f}%".format
+
+
+def _set_text(label: QLabel, text: str) -> None:
+    """Write label text only when it differs, sparing Qt's invalidation."""
+    if label.text() != text:
+        label.setText(text)
+
 
 class DashboardWidget(QWidget):
     """Dashboard widget with portfolio KPIs and metrics."""
@@ -44,6 +61,17 @@ class DashboardWidget(QWidget):
         super().__init__(parent)
         self.portfolio = portfolio or Portfolio()
         self.prices: Dict[str, float] = {}
+        # Key of the metrics currently shown; a matching key means neither
+        # positions nor prices changed, so the labels are already correct.
+        self._metrics_key: Optional[tuple] = None
+        self._last_pnl_positive: Optional[bool] = None
+        # Burst throttle: the first tick renders immediately, ticks landing
+        # within the window are coalesced into one trailing update
+        self._pending_prices: Optional[Dict[str, float]] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending_prices)
         self._setup_ui()
         logger.debug("Dashboard widget initialized")
 
@@ -112,39 +140,63 @@ class DashboardWidget(QWidget):
 
     def _update_display(self) -> None:
         """Update dashboard display with current data."""
+        # Each setText/setStyleSheet schedules its own repaint; suspending
+        # updates coalesces the whole refresh into a single paint event
+        self.setUpdatesEnabled(False)
+        try:
+            self._refresh_labels()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _refresh_labels(self) -> None:
+        """Recompute metrics and write them to the KPI labels."""
         # Number of positions (always available)
         num_positions = len(self.portfolio.get_all_positions())
-        self.positions_display.setText(str(num_positions))
+        _set_text(self.positions_display, str(num_positions))
 
         if not self.prices:
-            # No prices available
-            self.total_value_display.setText("—")
-            self.total_invested_display.setText("—")
-            self.pnl_display.setText("—")
-            self.pnl_pct_display.setText("—")
-            self.status_label.setText("Refresh prices to see metrics")
+            # No prices available; idle refreshes keep showing the same
+            # placeholders, so the writes are usually skipped entirely
+            self._metrics_key = None
+            _set_text(self.total_value_display, "—")
+            _set_text(self.total_invested_display, "—")
+            _set_text(self.pnl_display, "—")
+            _set_text(self.pnl_pct_display, "—")
+            _set_text(self.status_label, "Refresh prices to see metrics")
             return
 
-        # Calculate total invested
-        total_invested = sum(
-            pos.quantity * pos.buy_price for pos in self.portfolio.get_all_positions()
+        # Same portfolio version and same prices: the labels already show
+        # these metrics, so skip the O(N) recompute and Qt label updates
+        key = (
+            id(self.portfolio),
+            self.portfolio.version,
+            tuple(sorted(self.prices.items())),
         )
-        self.total_invested_display.setText(f"€{total_invested:,.2f}")
+        if key == self._metrics_key:
+            logger.debug("Dashboard metrics unchanged, skipping update")
+            return
+
+        # Total invested is memoized on the portfolio itself
+        total_invested = self.portfolio.total_invested
+        _set_text(self.total_invested_display, _FMT_EUR(total_invested))
 
-        # Calculate current value
-        total_value = calculate_portfolio_value(self.portfolio, self.prices)
-        self.total_value_display.setText(f"€{total_value:,.2f}")
+        # Value and P&L come out of one fused pass over the positions
+        total_value, pnl = calculate_value_and_pnl(self.portfolio, self.prices)
+        _set_text(self.total_value_display, _FMT_EUR(total_value))
 
-        # Calculate P&L
-        pnl = calculate_pnl(self.portfolio, self.prices)
-        pnl_color = "#2ca02c" if pnl >= 0 else "#d62728"  # green or red
-        self.pnl_display.setText(f"€{pnl:+,.2f}")
-        self.pnl_display.setStyleSheet(f"font-size: 18px; color: {pnl_color};")
+        # Restyle the P&L labels only when the sign flips
+        _set_text(self.pnl_display, _FMT_EUR_SIGN(pnl))
+        pnl_positive = pnl >= 0
+        if pnl_positive != self._last_pnl_positive:
+            style = _STYLE_PNL_POS if pnl_positive else _STYLE_PNL_NEG
+            self.pnl_display.setStyleSheet(style)
+            self.pnl_pct_display.setStyleSheet(style)
+            self._last_pnl_positive = pnl_positive
 
         # Calculate P&L percentage
         pnl_pct = (pnl / total_invested * 100) if total_invested > 0 else 0.0
-        self.pnl_pct_display.setText(f"{pnl_pct:+.2f}%")
-        self.pnl_pct_display.setStyleSheet(f"font-size: 18px; color: {pnl_color};")
+        _set_text(self.pnl_pct_display, _FMT_PCT(pnl_pct))
 
         # Update status
         manual_count = sum(
@@ -153,12 +205,16 @@ class DashboardWidget(QWidget):
             if pos.manual_price is not None
         )
         if manual_count > 0:
-            self.status_label.setText(
-                f"Last updated with {len(self.prices)} price(s) ({manual_count} manual)"
+            _set_text(
+                self.status_label,
+                f"Last updated with {len(self.prices)} price(s) ({manual_count} manual)",
             )
         else:
-            self.status_label.setText(f"Last updated with {len(self.prices)} price(s)")
+            _set_text(
+                self.status_label, f"Last updated with {len(self.prices)} price(s)"
+            )
 
+        self._metrics_key = key
         logger.debug("Dashboard display updated")
 
     def update_metrics(self, prices: Dict[str, float]) -> None:
@@ -171,10 +227,24 @@ class DashboardWidget(QWidget):
         Example:
             >>> dashboard.update_metrics({"EWLD.PA": 29.35, "PE500.PA": 43.12})
         """
+        if self._flush_timer.isActive():
+            # Inside the throttle window: remember only the latest prices
+            self._pending_prices = prices
+            return
         self.prices = prices
         self._update_display()
+        self._flush_timer.start()
         logger.info(f"Dashboard metrics updated with {len(prices)} prices")
 
+    def _flush_pending_prices(self) -> None:
+        """Apply the newest prices received during the throttle window."""
+        if self._pending_prices is None:
+            return
+        self.prices = self._pending_prices
+        self._pending_prices = None
+        self._update_display()
+        logger.debug("Dashboard flushed coalesced price update")
+
     def set_portfolio(self, portfolio: Portfolio) -> None:
         """
         Set a new portfolio and refresh the dashboard.
@@ -187,5 +257,6 @@ class DashboardWidget(QWidget):
         """
         self.portfolio = portfolio
         self.prices = {}  # Clear prices when portfolio changes
+        self._pending_prices = None  # Drop ticks queued for the old portfolio
         self._update_display()
         logger.info("Dashboard portfolio updated")
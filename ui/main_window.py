@@ -2,15 +2,32 @@
 Main application window for PEA ETF Tracker.
 
 Provides menu bar, toolbar, tabbed interface for portfolio and charts.
+
+Heavy dependencies (matplotlib, yfinance/pandas, the analytics stack) are
+imported lazily inside the methods that need them, keeping this module's
+import — and app startup — fast.
 """
 
 # mypy: disable-error-code="union-attr"
 
 import logging
+import os
+import threading
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict
-
-from PyQt6.QtCore import Qt, QTimer
+from typing import Dict, Optional
+
+from PyQt6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QFileDialog,
@@ -18,27 +35,123 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QStatusBar,
     QTabWidget,
+    QVBoxLayout,
+    QWidget,
 )
 
-from analytics.performance import (
-    calculate_allocation,
-    calculate_pnl,
-    calculate_portfolio_value,
-    calculate_position_values,
-)
 from config.settings import Settings, save_settings
-from data.market_data import fetch_price
 from data.portfolio import Portfolio
-from ui.chart_widget import ChartWidget
-from ui.dashboard import DashboardWidget
-from ui.portfolio_table import PortfolioTableWidget
 
 logger = logging.getLogger(__name__)
 
+# Auto-refresh slows down by this factor outside Euronext trading hours,
+# when polling would keep fetching identical closing prices
+OFF_HOURS_REFRESH_MULTIPLIER = 10
+
+
+class _PortfolioSaveQueue:
+    """Single-slot queue for background portfolio saves.
+
+    Snapshots are serialized on the GUI thread and submitted here; a newer
+    snapshot supersedes one still waiting, and a single drain worker does
+    the temp-file + atomic os.replace writes, so saves never interleave and
+    the newest state always wins.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Optional[tuple] = None  # (payload bytes, Path)
+        self._active = False
+
+    def submit(self, payload: bytes, path: Path) -> None:
+        with self._lock:
+            self._pending = (payload, path)
+            if self._active:
+                return
+            self._active = True
+        QThreadPool.globalInstance().start(_PortfolioSaveTask(self))
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                item = self._pending
+                self._pending = None
+                if item is None:
+                    self._active = False
+                    return
+            payload, path = item
+            try:
+                tmp_path = path.with_suffix(".json.tmp")
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, path)
+                logger.debug("Portfolio auto-saved")
+            except Exception as e:
+                logger.warning(f"Auto-save failed: {e}")
+
+
+class _PortfolioSaveTask(QRunnable):
+    """Drains the save queue on a pool thread."""
+
+    def __init__(self, queue: _PortfolioSaveQueue) -> None:
+        super().__init__()
+        self._queue = queue
+
+    def run(self) -> None:
+        self._queue._drain()
+
+
+class _PriceFetchTask(QRunnable):
+    """Fetches quotes for a list of tickers on the global thread pool.
+
+    All network I/O happens in run(); the result dict is handed back to the
+    GUI thread through the finished signal. One task covers the whole
+    batch — per-ticker fan-out happens inside fetch_prices, which already
+    bounds its own concurrency — so the GUI side tracks a single
+    completion instead of counting N workers.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(dict)
+        # Per-ticker partial results; queued onto the GUI thread by Qt
+        progress = pyqtSignal(str, float)
+
+    def __init__(self, tickers: list, max_concurrency: int = 8) -> None:
+        super().__init__()
+        self._tickers = tickers
+        self._max_concurrency = max_concurrency
+        self.signals = _PriceFetchTask.Signals()
+
+    def run(self) -> None:
+        # Imported here so yfinance/pandas load on the pool thread during
+        # the first fetch instead of at app start
+        from data.market_data import fetch_prices
+
+        # One batch entrypoint instead of N independent calls; market_data
+        # overlaps the per-ticker round-trips internally and streams each
+        # arrival through progress so slow tickers don't gate the fast ones
+        self.signals.finished.emit(
+            fetch_prices(
+                self._tickers,
+                max_concurrency=self._max_concurrency,
+                on_price=self.signals.progress.emit,
+            )
+        )
+
 
 class MainWindow(QMainWindow):
     """Main application window with menu, toolbar, tabs, and status bar."""
 
+    # Emitted with the current prices whenever they change; the single
+    # connected slot owns the canonical table/dashboard/chart/status-bar
+    # update order. Carrying the dict in the payload keeps the fan-out
+    # testable without reaching into window state.
+    pricesChanged = pyqtSignal(dict)
+
+    # Injectable seam for the construction-time price prefetch: the test
+    # suite flips this off so building a window with a populated
+    # portfolio never spawns real fetch threads.
+    PREFETCH_ON_STARTUP: bool = True
+
     def __init__(self, settings: Settings, portfolio: Portfolio) -> None:
         """
         Initialize main window.
@@ -50,15 +163,65 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.settings = settings
         self.portfolio = portfolio
+        # Every background task (fetch, prefetch, auto-save) shares the
+        # global pool; bound it once so fetch fan-out is user-tunable
+        QThreadPool.globalInstance().setMaxThreadCount(
+            max(2, settings.max_fetch_concurrency)
+        )
         self.prices: Dict[str, float] = {}
+        # Monotonic fetch timestamps per ticker, for freshness decisions
+        self._price_ts: Dict[str, float] = {}
+        self._seed_prices_from_cache()
+        self._refresh_inflight = False
+        self._fetch_task: Optional[_PriceFetchTask] = None
+        # Effective prices (manual overrides merged onto fetched quotes) are
+        # rebuilt lazily; chart-type toggles reuse the cached dict
+        self._effective_prices_cache: Dict[str, float] = {}
+        self._manual_price_count = 0
+        self._effective_prices_dirty = True
+        # Coalesces bursts of chart triggers into one rebuild per window
+        self._chart_update_pending = False
+        # Set when a chart update was skipped because the tab was hidden
+        self._chart_dirty = False
+        # Chart data key from the last render, rounded to displayed
+        # precision; unchanged allocations skip matplotlib entirely
+        self._last_alloc_key: Optional[tuple] = None
+        # Dirty flags + one idle timer coalesce bursts of edits into a
+        # single settings/portfolio write; closeEvent flushes synchronously
+        self._settings_dirty = False
+        self._portfolio_dirty = False
+        # Last (value, pnl) shown in the status bar, rounded to cents
+        self._last_status: Optional[tuple] = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_pending_saves)
+        self._save_queue = _PortfolioSaveQueue()
+        # One reusable file dialog for Open/Save/Import/Export; built on
+        # first use in _prompt_file_path
+        self._file_dialog: Optional[QFileDialog] = None
+        # One long-lived refresh timer, re-armed on settings changes rather
+        # than recreated; coarse timing is plenty at minute granularity
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.refresh_timer.timeout.connect(self._refresh_prices)
+        # True while auto-refresh is suspended because the window is
+        # minimized; lets restore distinguish paused from user-disabled
+        self._refresh_paused = False
 
         self._setup_ui()
+        self.pricesChanged.connect(self._apply_prices)
         self._load_geometry()
 
         # Auto-refresh timer
         if settings.auto_refresh_enabled:
             self._start_auto_refresh()
 
+        # Warm the price data while Qt finishes constructing/showing the
+        # window, so first paint has P&L instead of the cold "Ready" state
+        if self.PREFETCH_ON_STARTUP and self.portfolio.get_all_positions():
+            self._refresh_prices()
+
         logger.info("Main window initialized")
 
     def _setup_ui(self) -> None:
@@ -71,6 +234,10 @@ class MainWindow(QMainWindow):
 
     def _create_menu_bar(self) -> None:
         """Create menu bar with File, Edit, View, Help menus."""
+        # Built eagerly on purpose: the shortcuts (Ctrl+S, F5, ...) only
+        # fire once their QAction is parented into the window, and
+        # _set_refresh_enabled needs refresh_action before the startup
+        # prefetch. A dozen QActions is microseconds, not a startup cost.
         menubar = self.menuBar()
 
         # File menu
@@ -123,10 +290,10 @@ class MainWindow(QMainWindow):
 
         edit_menu.addSeparator()
 
-        refresh_action = QAction("&Refresh Prices", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self._refresh_prices)
-        edit_menu.addAction(refresh_action)
+        self.refresh_action = QAction("&Refresh Prices", self)
+        self.refresh_action.setShortcut("F5")
+        self.refresh_action.triggered.connect(self._refresh_prices)
+        edit_menu.addAction(self.refresh_action)
 
         refresh_all_action = QAction("Refresh &All Prices (including overrides)", self)
         refresh_all_action.setShortcut("Ctrl+Shift+F5")
@@ -161,12 +328,17 @@ class MainWindow(QMainWindow):
 
         toolbar.addSeparator()
 
-        refresh_action = QAction("Refresh", self)
-        refresh_action.triggered.connect(self._refresh_prices)
-        toolbar.addAction(refresh_action)
+        self.toolbar_refresh_action = QAction("Refresh", self)
+        self.toolbar_refresh_action.triggered.connect(self._refresh_prices)
+        toolbar.addAction(self.toolbar_refresh_action)
 
     def _create_central_widget(self) -> None:
         """Create tab widget with Portfolio, Dashboard, and Charts tabs."""
+        # Deferred so importing this module stays cheap; the chart stack
+        # (matplotlib) is deferred further, to first view of the Charts tab
+        from ui.dashboard import DashboardWidget
+        from ui.portfolio_table import PortfolioTableWidget
+
         self.tabs = QTabWidget()
 
         # Portfolio tab
@@ -182,13 +354,31 @@ class MainWindow(QMainWindow):
         self.dashboard = DashboardWidget(portfolio=self.portfolio)
         self.tabs.addTab(self.dashboard, "Dashboard")
 
-        # Charts tab
-        self.chart_widget = ChartWidget(preferences=self.settings.chart_preferences)
-        self.chart_widget.chart_type_changed.connect(self._on_chart_type_changed)
-        self.tabs.addTab(self.chart_widget, "Charts")
+        # Charts tab: an empty container whose ChartWidget is built on
+        # first view, keeping matplotlib figure/canvas setup off the
+        # startup path entirely
+        self._charts_tab = QWidget()
+        self._charts_layout = QVBoxLayout(self._charts_tab)
+        self._charts_layout.setContentsMargins(0, 0, 0, 0)
+        self.chart_widget = None
+        self.tabs.addTab(self._charts_tab, "Charts")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         self.setCentralWidget(self.tabs)
 
+    def _ensure_chart_widget(self) -> None:
+        """Build the ChartWidget the first time the Charts tab is shown."""
+        if self.chart_widget is not None:
+            return
+
+        # First (and only) point where matplotlib gets imported
+        from ui.chart_widget import ChartWidget
+
+        self.chart_widget = ChartWidget(preferences=self.settings.chart_preferences)
+        self.chart_widget.chart_type_changed.connect(self._on_chart_type_changed)
+        self._charts_layout.addWidget(self.chart_widget)
+        logger.debug("Chart widget built on first view of the Charts tab")
+
     def _create_status_bar(self) -> None:
         """Create status bar with portfolio value and P&L."""
         self.status_bar = QStatusBar()
@@ -196,44 +386,200 @@ class MainWindow(QMainWindow):
         self._update_status_bar()
 
     def _update_status_bar(self) -> None:
-        """Update status bar with current portfolio value and P&L."""
+        """Update status bar with current portfolio value and P&L.
+
+        One fused pass computes both figures, and the rounded-cents memo
+        below skips showMessage when the display would not change — safe
+        to call per streamed price arrival, not just per refresh.
+        """
+        from analytics.performance import calculate_value_and_pnl
+
         if self.prices:
-            total_value = calculate_portfolio_value(self.portfolio, self.prices)
-            pnl = calculate_pnl(self.portfolio, self.prices)
+            total_value, pnl = calculate_value_and_pnl(self.portfolio, self.prices)
+            # No-op refreshes (cancelled dialogs, cache hits) land on the
+            # same displayed cents; skip the format and repaint
+            key = (round(total_value, 2), round(pnl, 2))
+            if key == self._last_status:
+                return
             pnl_sign = "+" if pnl >= 0 else ""
             self.status_bar.showMessage(
                 f"Portfolio Value: €{total_value:.2f} | P&L: {pnl_sign}€{pnl:.2f}"
             )
+            self._last_status = key
         else:
-            self.status_bar.showMessage("Ready")
+            if self._last_status is not None or not self.status_bar.currentMessage():
+                self.status_bar.showMessage("Ready")
+                self._last_status = None
 
-    def _start_auto_refresh(self) -> None:
-        """Start auto-refresh timer for price updates."""
+    @staticmethod
+    def _is_market_open() -> bool:
+        """Return True during Euronext Paris core trading hours.
+
+        Weekdays 09:00-17:30 local time; the coarse check ignores market
+        holidays, which only costs a few harmless polls per year.
+        """
+        from datetime import datetime
+
+        now = datetime.now()
+        if now.weekday() >= 5:
+            return False
+        minutes = now.hour * 60 + now.minute
+        return 9 * 60 <= minutes <= 17 * 60 + 30
+
+    def _auto_refresh_interval_ms(self) -> int:
+        """Current auto-refresh interval, stretched outside market hours.
+
+        Quotes don't move while Euronext is closed, so polling at the
+        configured rate overnight and on weekends just refetches the same
+        values; the off-hours multiplier drops that traffic ~10x.
+        """
         interval_ms = self.settings.auto_refresh_interval_minutes * 60 * 1000
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._refresh_prices)
+        if not self._is_market_open():
+            interval_ms *= OFF_HOURS_REFRESH_MULTIPLIER
+        return interval_ms
+
+    def _start_auto_refresh(self) -> None:
+        """Start (or re-arm) the auto-refresh timer for price updates."""
+        interval_ms = self._auto_refresh_interval_ms()
         self.refresh_timer.start(interval_ms)
         logger.info(
             f"Auto-refresh enabled: {self.settings.auto_refresh_interval_minutes} min"
+            f" (next poll in {interval_ms // 1000} s)"
         )
 
+    def _seed_prices_from_cache(self) -> None:
+        """Seed prices from the on-disk cache so first paint has data.
+
+        The entries carry no fetch timestamps, so they all count as stale:
+        shown immediately and revalidated by the startup prefetch. The
+        price cache file is the persistence layer here — it is already
+        rewritten on every successful fetch, so mirroring prices into the
+        settings JSON would just store them twice.
+        """
+        from data.market_data import load_price_cache
+
+        try:
+            cached = load_price_cache()
+        except Exception as e:
+            logger.warning(f"Could not seed prices from cache: {e}")
+            return
+        tickers = {
+            position.ticker for position in self.portfolio.get_all_positions()
+        }
+        seed = {t: p for t, p in cached.items() if t in tickers}
+        if seed:
+            self.prices = seed
+            logger.info(f"Seeded {len(seed)} prices from disk cache")
+
     def _refresh_prices(self) -> None:
-        """Fetch latest prices and update UI (preserves manual overrides)."""
-        logger.info("Refreshing prices...")
-        self.prices = {}
+        """
+        Fetch latest prices and update UI (preserves manual overrides).
+
+        Stale-while-revalidate: previously fetched prices are shown
+        immediately, then revalidated in the background. Tickers fetched
+        within the fresh TTL skip the network entirely, and the remainder
+        go out as one fetch_prices batch rather than per-ticker calls.
+        Empty portfolios and fully-overridden ones return before any
+        network work, so idle timer ticks cost a few comparisons.
+        """
+        if self._refresh_inflight:
+            logger.debug("Refresh already in flight, ignoring")
+            return
 
-        for position in self.portfolio.get_all_positions():
-            price = fetch_price(position.ticker, use_cache=True)
-            if price:
-                self.prices[position.ticker] = price
+        positions = self.portfolio.get_all_positions()
+        if not positions:
+            self._on_prices_ready({})
+            return
 
-        # Update all components
-        self.portfolio_table.update_prices(self.prices)
-        self.dashboard.update_metrics(self.prices)
-        self._update_charts()
-        self._update_status_bar()
+        self._effective_prices_dirty = True
+
+        # Drop state for positions that left the portfolio
+        known = {position.ticker for position in positions}
+        self.prices = {t: p for t, p in self.prices.items() if t in known}
+        self._price_ts = {t: ts for t, ts in self._price_ts.items() if t in known}
+
+        # Serve whatever we already have; revalidation fills in behind
+        if self.prices:
+            self.pricesChanged.emit(self.prices)
+
+        now = time.monotonic()
+        fresh_ttl = self.settings.price_fresh_ttl_seconds
+        # Manual overrides beat fetched quotes everywhere downstream, so a
+        # network request for those tickers would be thrown away
+        to_fetch = [
+            position.ticker
+            for position in positions
+            if position.manual_price is None
+            and now - self._price_ts.get(position.ticker, float("-inf")) >= fresh_ttl
+        ]
+        if not to_fetch:
+            logger.debug("All prices fresh or overridden, skipping fetch")
+            return
 
-        logger.info(f"Prices refreshed for {len(self.prices)} positions")
+        logger.info("Refreshing prices...")
+        # The fetch runs on the global thread pool so the event loop keeps
+        # painting and accepting input; results come back via signal.
+        self._refresh_inflight = True
+        self._set_refresh_enabled(False)
+        task = _PriceFetchTask(to_fetch, self.settings.max_fetch_concurrency)
+        task.signals.progress.connect(self._on_price_progress)
+        task.signals.finished.connect(self._on_prices_ready)
+        # Keep the task referenced while it runs so its signal holder is not
+        # garbage collected before the worker emits
+        self._fetch_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _set_refresh_enabled(self, enabled: bool) -> None:
+        """Enable or disable the refresh actions while a fetch is in flight."""
+        self.refresh_action.setEnabled(enabled)
+        self.toolbar_refresh_action.setEnabled(enabled)
+
+    def _on_price_progress(self, ticker: str, price: float) -> None:
+        """Render one ticker's fresh price as soon as it arrives (GUI thread).
+
+        The downstream debounce/throttle layers coalesce these per-ticker
+        emissions, so incremental rendering stays cheap.
+        """
+        self.prices[ticker] = price
+        self._price_ts[ticker] = time.monotonic()
+        self._effective_prices_dirty = True
+        self.pricesChanged.emit(self.prices)
+
+    def _on_prices_ready(self, prices: Dict[str, float]) -> None:
+        """Merge freshly fetched prices and update every widget (GUI thread)."""
+        now = time.monotonic()
+        self.prices.update(prices)
+        for ticker in prices:
+            self._price_ts[ticker] = now
+        self._effective_prices_dirty = True
+        self._refresh_inflight = False
+        self._fetch_task = None
+        self._set_refresh_enabled(True)
+
+        # Re-evaluate the poll rate so the timer adapts as the market
+        # opens or closes between refreshes
+        if self.refresh_timer.isActive():
+            self.refresh_timer.setInterval(self._auto_refresh_interval_ms())
+
+        self.pricesChanged.emit(self.prices)
+
+        logger.info(f"Prices refreshed for {len(prices)} positions")
+
+    def _apply_prices(self, prices: Dict[str, float]) -> None:
+        """Push the given prices into the table, dashboard and charts."""
+        # Suspend painting so the per-widget updates land as one repaint
+        # instead of a cascade of intermediate frames. Toggled on the
+        # window, not the central widget, so the status bar is covered too;
+        # the finally block guarantees painting resumes on any failure.
+        self.setUpdatesEnabled(False)
+        try:
+            self.portfolio_table.update_prices(prices)
+            self.dashboard.update_metrics(prices)
+            self._request_chart_update()
+            self._update_status_bar()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _refresh_all_prices(self) -> None:
         """Fetch latest prices and clear all manual overrides."""
@@ -243,7 +589,9 @@ class MainWindow(QMainWindow):
         for position in self.portfolio.get_all_positions():
             if position.manual_price is not None:
                 logger.info(f"Clearing manual price override for {position.ticker}")
-                position.manual_price = None
+                self.portfolio.update_position(
+                    position.ticker, replace(position, manual_price=None)
+                )
 
         # Fetch fresh prices
         self._refresh_prices()
@@ -262,6 +610,7 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.portfolio = Portfolio()
+            self._effective_prices_dirty = True
             self.portfolio_table.set_portfolio(self.portfolio)
             self.dashboard.set_portfolio(self.portfolio)
             self.settings.last_portfolio_path = ""
@@ -269,19 +618,64 @@ class MainWindow(QMainWindow):
             self._update_status_bar()
             logger.info("Created new portfolio")
 
+    def _prompt_file_path(self, title: str, name_filter: str, save: bool) -> str:
+        """Run the shared file dialog and return the chosen path.
+
+        One lazily built non-native dialog is reconfigured per call and
+        reused across Open/Save/Import/Export, so only the first
+        invocation pays for dialog construction. Non-native means no
+        platform shell scanning directories behind the event loop, and
+        exec() spins a nested event loop, so timers and repaints keep
+        running while the dialog is up.
+
+        Args:
+            title: Window title for this invocation.
+            name_filter: File name filter (e.g. "JSON Files (*.json)").
+            save: True for a save dialog, False for an open dialog.
+
+        Returns:
+            Selected file path, or empty string if cancelled.
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setOption(
+                QFileDialog.Option.DontUseNativeDialog, True
+            )
+
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilter(name_filter)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+
+        if dialog.exec():
+            selected = dialog.selectedFiles()
+            return selected[0] if selected else ""
+        return ""
+
     def _open_portfolio(self) -> None:
-        """Open portfolio from JSON file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Portfolio", "", "JSON Files (*.json)"
+        """Open portfolio from JSON file.
+
+        Load runs synchronously: portfolio documents are a few KB, and
+        the success/error dialog needs the result anyway. The frequent
+        write path (auto-save) is the one that runs on the pool.
+        """
+        file_path = self._prompt_file_path(
+            "Open Portfolio", "JSON Files (*.json)", save=False
         )
 
         if file_path:
             try:
                 self.portfolio = Portfolio.load_from_json(Path(file_path))
+                self._effective_prices_dirty = True
                 self.portfolio_table.set_portfolio(self.portfolio)
                 self.dashboard.set_portfolio(self.portfolio)
                 self.settings.last_portfolio_path = file_path
-                save_settings(self.settings)
+                self._schedule_settings_save()
                 self.prices = {}
                 self._update_status_bar()
                 logger.info(f"Opened portfolio: {file_path}")
@@ -298,14 +692,14 @@ class MainWindow(QMainWindow):
 
     def _save_portfolio_as(self) -> None:
         """Save portfolio to a new JSON file."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Portfolio As", "", "JSON Files (*.json)"
+        file_path = self._prompt_file_path(
+            "Save Portfolio As", "JSON Files (*.json)", save=True
         )
 
         if file_path:
             self._save_to_file(Path(file_path))
             self.settings.last_portfolio_path = file_path
-            save_settings(self.settings)
+            self._schedule_settings_save()
 
     def _save_to_file(self, path: Path) -> None:
         """
@@ -315,7 +709,8 @@ class MainWindow(QMainWindow):
             path: Path to save portfolio.
         """
         try:
-            self.portfolio.save_to_json(path)
+            # Explicit user save: worth an fsync for durability
+            self.portfolio.save_to_json(path, fsync=True)
             logger.info(f"Saved portfolio: {path}")
             QMessageBox.information(self, "Success", "Portfolio saved successfully")
         except Exception as e:
@@ -324,13 +719,14 @@ class MainWindow(QMainWindow):
 
     def _import_csv(self) -> None:
         """Import portfolio from CSV file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import CSV", "", "CSV Files (*.csv)"
+        file_path = self._prompt_file_path(
+            "Import CSV", "CSV Files (*.csv)", save=False
         )
 
         if file_path:
             try:
                 self.portfolio = Portfolio.import_from_csv(Path(file_path))
+                self._effective_prices_dirty = True
                 self.portfolio_table.set_portfolio(self.portfolio)
                 self.dashboard.set_portfolio(self.portfolio)
                 self.prices = {}
@@ -345,8 +741,8 @@ class MainWindow(QMainWindow):
 
     def _export_csv(self) -> None:
         """Export portfolio to CSV file."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export CSV", "", "CSV Files (*.csv)"
+        file_path = self._prompt_file_path(
+            "Export CSV", "CSV Files (*.csv)", save=True
         )
 
         if file_path:
@@ -375,12 +771,18 @@ class MainWindow(QMainWindow):
         from ui.position_dialog import PositionDialog
 
         dialog = PositionDialog(self, mode="add")
-        if dialog.exec():
+
+        def on_accepted() -> None:
             try:
                 position = dialog.get_position()
                 self.portfolio.add_position(position)
-                self.portfolio_table.set_portfolio(self.portfolio)
-                self.dashboard.set_portfolio(self.portfolio)
+                self._effective_prices_dirty = True
+                # Single-row delta; a full set_portfolio would rebuild the
+                # whole table and drop displayed prices. Rapid edits are
+                # already coalesced downstream: the dashboard throttles its
+                # repaints and auto-saves share one idle timer.
+                self.portfolio_table.add_row(position)
+                self.dashboard.update_metrics(self.prices)
                 self._auto_save_portfolio()
                 logger.info(f"Added position: {position.ticker}")
                 QMessageBox.information(
@@ -390,6 +792,10 @@ class MainWindow(QMainWindow):
                 logger.warning(f"Could not add position: {e}")
                 QMessageBox.warning(self, "Error", f"Could not add position:\n{e}")
 
+        # open() instead of exec(): no nested event loop, so auto-refresh
+        # and auto-save timers keep running behind the dialog
+        dialog.open_for_result(on_accepted)
+
     def _edit_position(self, ticker: str) -> None:
         """Show dialog to edit position."""
         from ui.position_dialog import PositionDialog
@@ -400,12 +806,14 @@ class MainWindow(QMainWindow):
             return
 
         dialog = PositionDialog(self, position=position, mode="edit")
-        if dialog.exec():
+
+        def on_accepted() -> None:
             try:
                 new_position = dialog.get_position()
                 self.portfolio.update_position(ticker, new_position)
-                self.portfolio_table.set_portfolio(self.portfolio)
-                self.dashboard.set_portfolio(self.portfolio)
+                self._effective_prices_dirty = True
+                self.portfolio_table.update_row(ticker, new_position)
+                self.dashboard.update_metrics(self.prices)
                 self._auto_save_portfolio()
                 logger.info(f"Updated position: {ticker}")
                 QMessageBox.information(self, "Success", f"Updated position {ticker}")
@@ -413,6 +821,8 @@ class MainWindow(QMainWindow):
                 logger.warning(f"Could not update position: {e}")
                 QMessageBox.warning(self, "Error", f"Could not update position:\n{e}")
 
+        dialog.open_for_result(on_accepted)
+
     def _delete_position(self, ticker: str) -> None:
         """Delete position after confirmation."""
         reply = QMessageBox.question(
@@ -425,8 +835,9 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.portfolio.remove_position(ticker)
-                self.portfolio_table.set_portfolio(self.portfolio)
-                self.dashboard.set_portfolio(self.portfolio)
+                self._effective_prices_dirty = True
+                self.portfolio_table.remove_row(ticker)
+                self.dashboard.update_metrics(self.prices)
                 self._auto_save_portfolio()
                 logger.info(f"Deleted position: {ticker}")
                 QMessageBox.information(self, "Success", f"Deleted position {ticker}")
@@ -470,19 +881,21 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             if dialog.is_cleared():
                 # Clear manual override
-                position.manual_price = None
+                self.portfolio.update_position(
+                    ticker, replace(position, manual_price=None)
+                )
                 logger.info(f"Cleared manual price for {ticker}")
             else:
                 # Set manual price
                 manual_price = dialog.get_manual_price()
-                position.manual_price = manual_price
+                self.portfolio.update_position(
+                    ticker, replace(position, manual_price=manual_price)
+                )
                 logger.info(f"Set manual price for {ticker}: €{manual_price:.2f}")
 
             # Refresh UI (including charts)
-            self.portfolio_table.update_prices(self.prices)
-            self.dashboard.update_metrics(self.prices)
-            self._update_charts()
-            self._update_status_bar()
+            self._effective_prices_dirty = True
+            self.pricesChanged.emit(self.prices)
             self._auto_save_portfolio()
 
     def _show_settings(self) -> None:
@@ -490,32 +903,65 @@ class MainWindow(QMainWindow):
         from ui.settings_dialog import SettingsDialog
 
         dialog = SettingsDialog(self, self.settings)
-        if dialog.exec():
+
+        def on_accepted() -> None:
             # Settings already saved in dialog.accept()
             self._apply_settings()
             logger.info("Settings updated")
 
+        dialog.open_for_result(on_accepted)
+
     def _apply_settings(self) -> None:
         """Apply settings changes to UI."""
-        # Restart auto-refresh timer if interval changed
-        if hasattr(self, "refresh_timer"):
-            self.refresh_timer.stop()
+        # Re-arm the auto-refresh timer in case the interval changed
+        self.refresh_timer.stop()
         if self.settings.auto_refresh_enabled:
             self._start_auto_refresh()
 
-        # Update chart preferences
-        self.chart_widget.preferences = self.settings.chart_preferences
+        # Update chart preferences (a not-yet-built chart widget picks
+        # them up at construction)
+        if self.chart_widget is not None:
+            self.chart_widget.preferences = self.settings.chart_preferences
 
         logger.debug("Settings applied to UI")
 
+    def _schedule_settings_save(self) -> None:
+        """Mark settings dirty and arm the coalescing save timer.
+
+        Every settings mutation (open/save-as path changes, the settings
+        dialog) routes through here rather than writing JSON in place;
+        closeEvent flushes whatever is still pending.
+        """
+        self._settings_dirty = True
+        self._save_timer.start()
+
     def _auto_save_portfolio(self) -> None:
-        """Auto-save portfolio to last used path."""
+        """Schedule an auto-save of the portfolio to the last used path."""
         if self.settings.last_portfolio_path:
+            self._portfolio_dirty = True
+            self._save_timer.start()
+
+    def _flush_pending_saves(self) -> None:
+        """Write out whatever the coalescing timer accumulated."""
+        if self._settings_dirty:
+            self._settings_dirty = False
             try:
-                self.portfolio.save_to_json(Path(self.settings.last_portfolio_path))
-                logger.debug("Portfolio auto-saved")
+                save_settings(self.settings)
+                logger.debug("Settings saved")
+            except Exception as e:
+                logger.warning(f"Settings save failed: {e}")
+        if self._portfolio_dirty:
+            self._portfolio_dirty = False
+            # Serialize on the GUI thread (cheap, and the portfolio is only
+            # mutated here); the disk write runs on the pool
+            try:
+                payload = self.portfolio.to_json_bytes()
             except Exception as e:
                 logger.warning(f"Auto-save failed: {e}")
+                return
+            self._save_queue.submit(
+                payload, Path(self.settings.last_portfolio_path)
+            )
 
     def _on_chart_type_changed(self, chart_type: str) -> None:
         """
@@ -525,24 +971,71 @@ class MainWindow(QMainWindow):
             chart_type: Selected chart type name.
         """
         logger.debug("Chart type changed to: %s", chart_type)
+        self._request_chart_update()
+
+    def _effective_prices(self) -> Dict[str, float]:
+        """Return effective prices, rebuilding the cache only when dirty."""
+        if self._effective_prices_dirty:
+            # Manual prices override fetched prices; count overrides in the
+            # same pass so the debug log does not re-walk the positions
+            effective_prices: Dict[str, float] = {}
+            manual_count = 0
+            for position in self.portfolio.get_all_positions():
+                if position.manual_price is not None:
+                    effective_prices[position.ticker] = position.manual_price
+                    manual_count += 1
+                elif position.ticker in self.prices:
+                    effective_prices[position.ticker] = self.prices[position.ticker]
+            self._effective_prices_cache = effective_prices
+            self._manual_price_count = manual_count
+            self._effective_prices_dirty = False
+        return self._effective_prices_cache
+
+    def _request_chart_update(self) -> None:
+        """Schedule a chart rebuild, coalescing near-simultaneous requests."""
+        if self._chart_update_pending:
+            return
+        self._chart_update_pending = True
+        QTimer.singleShot(75, self._do_chart_update)
+
+    def _do_chart_update(self) -> None:
+        """Run the debounced chart rebuild."""
+        self._chart_update_pending = False
         self._update_charts()
 
+    def _on_tab_changed(self, index: int) -> None:
+        """Render any chart update deferred while the Charts tab was hidden.
+
+        Together with the hidden-tab early return in _update_charts this
+        means refreshes cost no matplotlib time unless Charts is showing.
+        """
+        if self.tabs.currentWidget() is self._charts_tab:
+            self._ensure_chart_widget()
+            if self._chart_dirty:
+                self._request_chart_update()
+
     def _update_charts(self) -> None:
         """Update charts with latest data (manual + fetched prices)."""
-        # Collect effective prices (manual prices override fetched prices)
-        effective_prices: Dict[str, float] = {}
+        # Rendering a hidden tab is pure waste; remember that data changed
+        # and catch up when the user switches to Charts
+        if self.tabs.currentWidget() is not self._charts_tab:
+            self._chart_dirty = True
+            logger.debug("Charts tab hidden, deferring chart update")
+            return
+        self._ensure_chart_widget()
+        self._chart_dirty = False
 
-        for position in self.portfolio.get_all_positions():
-            if position.manual_price is not None:
-                # Use manual price if set
-                effective_prices[position.ticker] = position.manual_price
-            elif position.ticker in self.prices:
-                # Use fetched price if available
-                effective_prices[position.ticker] = self.prices[position.ticker]
+        from analytics.performance import (
+            calculate_allocation,
+            calculate_position_values,
+        )
+
+        effective_prices = self._effective_prices()
 
         # If no prices available, show empty state message
         if not effective_prices:
             self.chart_widget.show_empty_state()
+            self._last_alloc_key = None
             logger.debug("No price data available for charts")
             return
 
@@ -556,9 +1049,20 @@ class MainWindow(QMainWindow):
                 if allocation:
                     tickers = list(allocation.keys())
                     percentages = [allocation[t] * 100 for t in tickers]
+                    # Tiny price moves usually round to the same displayed
+                    # percentages; don't touch the chart for those
+                    key = (
+                        chart_type,
+                        tuple(tickers),
+                        tuple(round(p, 2) for p in percentages),
+                    )
+                    if key == self._last_alloc_key:
+                        logger.debug("Allocation unchanged, skipping chart")
+                        return
                     self.chart_widget.display_chart(
                         chart_type, tickers, percentages=percentages
                     )
+                    self._last_alloc_key = key
             elif chart_type == "Allocation Bar":
                 # Create allocation bar chart
                 position_values = calculate_position_values(
@@ -566,34 +1070,87 @@ class MainWindow(QMainWindow):
                 )
                 if position_values:
                     tickers = list(position_values.keys())
+                    key = (
+                        chart_type,
+                        tuple(sorted((t, round(v, 2)) for t, v in position_values.items())),
+                    )
+                    if key == self._last_alloc_key:
+                        logger.debug("Position values unchanged, skipping chart")
+                        return
                     self.chart_widget.display_chart(
                         chart_type, tickers, values=position_values
                     )
-
-            logger.debug(
-                "Charts updated with %d positions (%d manual, %d fetched)",
-                len(effective_prices),
-                sum(1 for p in self.portfolio.get_all_positions() if p.manual_price),
-                len(self.prices),
-            )
+                    self._last_alloc_key = key
+
+            # Skip building the log arguments entirely at INFO level
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Charts updated with %d positions (%d manual, %d fetched)",
+                    len(effective_prices),
+                    self._manual_price_count,
+                    len(self.prices),
+                )
         except Exception as e:
             logger.warning("Could not update charts: %s", e)
 
     def _load_geometry(self) -> None:
-        """Load window geometry from settings."""
+        """Restore window geometry from QSettings, JSON settings as fallback."""
+        stored = QSettings("PEA", "ETFTracker").value("geometry")
+        if stored is not None and self.restoreGeometry(stored):
+            logger.debug("Window geometry restored from QSettings")
+            return
         geom = self.settings.window_geometry
         self.setGeometry(geom.x, geom.y, geom.width, geom.height)
         logger.debug("Window geometry loaded")
 
     def _save_geometry(self) -> None:
-        """Save current window geometry to settings."""
+        """Save current window geometry via QSettings.
+
+        Geometry churns on every move/resize, so it lives in Qt's binary
+        store instead of forcing a full JSON settings rewrite on close.
+        The JSON fields are still mirrored as the fallback for machines
+        without a QSettings entry. No-op when the geometry is unchanged,
+        so this is safe to hook to move/resize events later.
+        """
         rect = self.geometry()
+        geom = self.settings.window_geometry
+        if (rect.x(), rect.y(), rect.width(), rect.height()) == (
+            geom.x,
+            geom.y,
+            geom.width,
+            geom.height,
+        ):
+            logger.debug("Window geometry unchanged, skipping save")
+            return
+        QSettings("PEA", "ETFTracker").setValue("geometry", self.saveGeometry())
         self.settings.window_geometry.x = rect.x()
         self.settings.window_geometry.y = rect.y()
         self.settings.window_geometry.width = rect.width()
         self.settings.window_geometry.height = rect.height()
         logger.debug("Window geometry saved")
 
+    def changeEvent(self, event) -> None:  # type: ignore
+        """
+        Pause auto-refresh while minimized; resume and catch up on restore.
+
+        Args:
+            event: Change event.
+        """
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                if self.refresh_timer.isActive():
+                    self.refresh_timer.stop()
+                    self._refresh_paused = True
+                    logger.debug("Auto-refresh paused while minimized")
+            elif self._refresh_paused:
+                self._refresh_paused = False
+                self._start_auto_refresh()
+                # Catch up immediately; the fresh-TTL check keeps this cheap
+                # if the window was only minimized briefly
+                self._refresh_prices()
+                logger.debug("Auto-refresh resumed after restore")
+        super().changeEvent(event)
+
     def showEvent(self, event) -> None:  # type: ignore
         """
         Handle window show event.
@@ -608,16 +1165,32 @@ class MainWindow(QMainWindow):
         if not hasattr(self, "_charts_initialized"):
             self._charts_initialized = True
             if self.portfolio.get_all_positions():
-                self._update_charts()
+                self._request_chart_update()
 
     def closeEvent(self, event) -> None:  # type: ignore
         """
         Handle window close event.
 
+        This is the only place settings are written synchronously; every
+        other mutation goes through the 500 ms coalescing timer.
+
         Args:
             event: Close event.
         """
         self._save_geometry()
-        save_settings(self.settings)
+        # Flush anything still sitting behind the coalescing timer; the
+        # portfolio is written synchronously here since the worker pool may
+        # not outlive the window. Geometry went to QSettings above, so the
+        # JSON settings are only rewritten if something else changed.
+        self._save_timer.stop()
+        if self._portfolio_dirty:
+            self._portfolio_dirty = False
+            try:
+                self.portfolio.save_to_json(
+                    Path(self.settings.last_portfolio_path), fsync=True
+                )
+            except Exception as e:
+                logger.warning(f"Auto-save failed: {e}")
+        self._flush_pending_saves()
         logger.info("Application closed")
         event.accept()
@@ -14,7 +14,6 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QFormLayout,
     QLabel,
-    QMessageBox,
     QPushButton,
     QVBoxLayout,
     QWidget,
@@ -105,6 +104,8 @@ class ManualPriceDialog(QDialog):
         price_layout = QFormLayout()
         self.price_input = QDoubleSpinBox()
         self.price_input.setRange(0.01, 999999.99)
+        # No valueChanged per keystroke; one signal when editing finishes
+        self.price_input.setKeyboardTracking(False)
         self.price_input.setDecimals(2)
         self.price_input.setPrefix("€")
         if self.current_price is not None:
@@ -140,20 +141,6 @@ class ManualPriceDialog(QDialog):
         self.setLayout(layout)
         self.setMinimumWidth(400)
 
-    def _validate_input(self) -> bool:
-        """
-        Validate manual price input.
-
-        Returns:
-            True if input is valid, False otherwise.
-        """
-        if self.price_input.value() <= 0:
-            QMessageBox.warning(
-                self, "Validation Error", "Price must be positive and greater than zero"
-            )
-            return False
-        return True
-
     def _clear_override(self) -> None:
         """Handle Clear Override button click."""
         self._cleared = True
@@ -162,13 +149,16 @@ class ManualPriceDialog(QDialog):
         super().accept()
 
     def accept(self) -> None:
-        """Handle OK button click with validation."""
-        if self._validate_input():
-            self._manual_price = self.price_input.value()
-            logger.info(
-                "Manual price set for %s: €%.2f", self.ticker, self._manual_price
-            )
-            super().accept()
+        """Handle OK button click.
+
+        No validation pass: the spinbox range (0.01 minimum) already
+        clamps anything non-positive before it can be accepted.
+        """
+        self._manual_price = self.price_input.value()
+        logger.info(
+            "Manual price set for %s: €%.2f", self.ticker, self._manual_price
+        )
+        super().accept()
 
     def get_manual_price(self) -> Optional[float]:
         """
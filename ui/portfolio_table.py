@@ -8,17 +8,66 @@ buy price, current price, P&L, and P&L percentage.
 import logging
 from typing import Dict
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QBrush, QColor
 from PyQt6.QtWidgets import QHeaderView, QMenu, QTableWidget, QTableWidgetItem
 
-from data.portfolio import Portfolio
+from data.portfolio import ETFPosition, Portfolio
 
 logger = logging.getLogger(__name__)
 
+# Shared cell resources, built once instead of per cell per refresh
+_RIGHT_ALIGN = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_MANUAL_PRICE_BRUSH = QBrush(QColor("#90EE90"))
+_CLEAR_BRUSH = QBrush()
+_MANUAL_PRICE_TOOLTIP = "Manual Price (overridden)"
+
+# Minimum interval between price repaints: roughly one frame at 60 Hz, so
+# streamed per-ticker arrivals coalesce instead of outpacing the display
+PRICE_FLUSH_INTERVAL_MS = 16
+
+
+class _NumericItem(QTableWidgetItem):
+    """Table item that sorts by a stored number, not its display text.
+
+    String sorting puts "10.00" before "9.00"; comparing the underlying
+    float fixes the order and is cheaper than string comparison. Cells
+    without a value yet carry -inf so they group below real numbers.
+    """
+
+    def __init__(self, value: float, text: str) -> None:
+        super().__init__(text)
+        self._value = value
+
+    def set_value(self, value: float, text: str) -> None:
+        """Update the sort key and display text together."""
+        self._value = value
+        self.setText(text)
+
+    def __lt__(self, other: QTableWidgetItem) -> bool:
+        if isinstance(other, _NumericItem):
+            return self._value < other._value
+        return super().__lt__(other)
+
+
+def _set_numeric(item: QTableWidgetItem, value: float, text: str) -> None:
+    """Write value/text into a cell, keeping the sort key in sync."""
+    if isinstance(item, _NumericItem):
+        item.set_value(value, text)
+    else:
+        item.setText(text)
+
 
 class PortfolioTableWidget(QTableWidget):
-    """Table widget displaying portfolio positions."""
+    """Table widget displaying portfolio positions.
+
+    Stays on QTableWidget rather than a QAbstractTableModel/QTableView
+    split: at PEA portfolio sizes (tens of rows, 7 columns) the per-item
+    overhead is negligible, and the in-place cell rewrites plus
+    unchanged-row skips already reduce refreshes to the cells that
+    actually moved — which is what a model's dataChanged rectangle would
+    buy. Worth revisiting only if row counts grow by orders of magnitude.
+    """
 
     # Signals
     position_edit_requested = pyqtSignal(str)  # ticker
@@ -34,6 +83,16 @@ class PortfolioTableWidget(QTableWidget):
         """
         super().__init__()
         self.portfolio = portfolio
+        # Prices received inside the flush window, applied in one batch
+        # when the coalescing timer fires
+        self._pending_prices: Dict[str, float] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(PRICE_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_prices)
+        # Last (price, pnl, pnl_pct, is_manual) written per ticker; rows
+        # whose values did not move skip the Qt item writes entirely
+        self._price_state: Dict[str, tuple] = {}
         self._setup_table()
         self._setup_context_menu()
         self._setup_double_click()
@@ -79,32 +138,111 @@ class PortfolioTableWidget(QTableWidget):
         """Populate table with portfolio positions."""
         positions = self.portfolio.get_all_positions()
         self.setRowCount(len(positions))
+        self._price_state.clear()
+
+        # Sorting would reorder rows mid-write; suspend it for the rebuild
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            for row, position in enumerate(positions):
+                self._set_row(row, position)
+        finally:
+            self.setSortingEnabled(sorting)
+
+    def _set_row(self, row: int, position: ETFPosition) -> None:
+        """Write one position into the given row, resetting price cells."""
+        # Ticker
+        self.setItem(row, 0, QTableWidgetItem(position.ticker))
+
+        # Name
+        self.setItem(row, 1, QTableWidgetItem(position.name))
+
+        # Quantity
+        quantity_item = _NumericItem(position.quantity, str(position.quantity))
+        quantity_item.setTextAlignment(_RIGHT_ALIGN)
+        self.setItem(row, 2, quantity_item)
+
+        # Buy Price
+        buy_price_item = _NumericItem(
+            position.buy_price, f"{position.buy_price:.2f}"
+        )
+        buy_price_item.setTextAlignment(_RIGHT_ALIGN)
+        self.setItem(row, 3, buy_price_item)
+
+        # Current price, P&L, P&L% placeholders; the items are created
+        # once here and rewritten in place on price updates
+        for col in (4, 5, 6):
+            item = _NumericItem(float("-inf"), "-")
+            item.setTextAlignment(_RIGHT_ALIGN)
+            self.setItem(row, col, item)
+        self._price_state.pop(position.ticker, None)
+
+    def _row_for_ticker(self, ticker: str) -> int:
+        """Return the row currently displaying ticker, or -1.
+
+        A linear scan is deliberate: sorting can reorder rows at any time,
+        so a ticker->row map would need rebuilding on every sort while the
+        scan stays trivially correct.
+        """
+        for row in range(self.rowCount()):
+            item = self.item(row, 0)
+            if item and item.text() == ticker:
+                return row
+        return -1
 
-        for row, position in enumerate(positions):
-            # Ticker
-            self.setItem(row, 0, QTableWidgetItem(position.ticker))
+    def add_row(self, position: ETFPosition) -> None:
+        """
+        Append a single position without rebuilding the table.
 
-            # Name
-            self.setItem(row, 1, QTableWidgetItem(position.name))
+        Args:
+            position: Position to display.
+        """
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            row = self.rowCount()
+            self.insertRow(row)
+            self._set_row(row, position)
+        finally:
+            self.setSortingEnabled(sorting)
+        logger.debug("Added table row for %s", position.ticker)
+
+    def update_row(self, ticker: str, position: ETFPosition) -> None:
+        """
+        Rewrite the row for ticker in place.
 
-            # Quantity
-            quantity_item = QTableWidgetItem(str(position.quantity))
-            quantity_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.setItem(row, 2, quantity_item)
+        Falls back to a full rebuild if the ticker is not displayed.
 
-            # Buy Price
-            buy_price_item = QTableWidgetItem(f"{position.buy_price:.2f}")
-            buy_price_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.setItem(row, 3, buy_price_item)
+        Args:
+            ticker: Ticker currently shown in the row.
+            position: Updated position (may carry a new ticker).
+        """
+        row = self._row_for_ticker(ticker)
+        if row < 0:
+            self._populate_table()
+            return
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            self._price_state.pop(ticker, None)
+            self._set_row(row, position)
+        finally:
+            self.setSortingEnabled(sorting)
+        logger.debug("Updated table row for %s", ticker)
+
+    def remove_row(self, ticker: str) -> None:
+        """
+        Remove the row for ticker without rebuilding the table.
 
-            # Current price, P&L, P&L% will be filled when prices are updated
-            self.setItem(row, 4, QTableWidgetItem("-"))
-            self.setItem(row, 5, QTableWidgetItem("-"))
-            self.setItem(row, 6, QTableWidgetItem("-"))
+        Args:
+            ticker: Ticker whose row should be removed.
+        """
+        row = self._row_for_ticker(ticker)
+        if row < 0:
+            return
+        self.removeRow(row)
+        self._price_state.pop(ticker, None)
+        logger.debug("Removed table row for %s", ticker)
 
     def _on_cell_double_click(self, row: int, column: int) -> None:
         """
@@ -127,14 +265,64 @@ class PortfolioTableWidget(QTableWidget):
         Update current prices and recalculate P&L for all positions.
 
         Uses manual price override if set, otherwise uses fetched price.
+        Bursts of updates (streamed per-ticker arrivals) are coalesced:
+        the first applies immediately, the rest merge and flush together
+        once per frame interval.
 
         Args:
             prices: Dictionary mapping ticker to fetched price.
         """
+        if self._flush_timer.isActive():
+            # Inside the flush window: merge and wait for the timer
+            self._pending_prices.update(prices)
+            return
+        self._apply_prices(prices)
+        self._flush_timer.start()
+
+    def _flush_pending_prices(self) -> None:
+        """Apply the prices merged during the coalescing window."""
+        if not self._pending_prices:
+            return
+        pending = self._pending_prices
+        self._pending_prices = {}
+        self._apply_prices(pending)
+        logger.debug("Table flushed coalesced price update")
+
+    def _apply_prices(self, prices: Dict[str, float]) -> None:
+        """Write prices and recalculated P&L into the visible rows.
+
+        The price/P&L items created in _set_row are rewritten in place,
+        and rows whose values match the last write are skipped outright,
+        so an idle refresh costs no Qt item churn.
+        """
+        # With sorting live, every setText on a sorted column could
+        # trigger a full re-sort mid-loop; suspend it for the batch
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            self._write_price_rows(prices)
+        finally:
+            self.setSortingEnabled(sorting)
+
+    def _write_price_rows(self, prices: Dict[str, float]) -> None:
+        """Per-row body of _apply_prices, run with sorting suspended.
+
+        Scalar per-row arithmetic is deliberate: the unchanged-row skip
+        leaves a handful of multiplications per changed row, and rows can
+        be in any sort order, so aligning a NumPy vector with the view
+        would cost more than it saves. Portfolio-level aggregates are
+        where the vectorized math lives (analytics.performance). The same
+        goes for the f-string formatting: only changed rows reach it, and
+        a changed row needs a string the cache has not seen.
+        """
+        # One level check instead of walking the logger chain per row
+        debug = logger.isEnabledFor(logging.DEBUG)
         for row in range(self.rowCount()):
             ticker_item = self.item(row, 0)
             if ticker_item:
                 ticker = ticker_item.text()
+                # O(1): the portfolio stores positions in a ticker-keyed
+                # dict, so this is not the O(N^2) scan it looks like
                 position = self.portfolio.get_position(ticker)
 
                 if position:
@@ -151,47 +339,48 @@ class PortfolioTableWidget(QTableWidget):
                         # No price available
                         continue
 
-                    # Current Price
-                    current_price_item = QTableWidgetItem(f"{current_price:.2f}")
-                    current_price_item.setTextAlignment(
-                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                    )
-
-                    # Visual indicator for manual prices
-                    if is_manual:
-                        current_price_item.setBackground(QBrush(QColor("#90EE90")))
-                        current_price_item.setToolTip("Manual Price (overridden)")
-
-                    self.setItem(row, 4, current_price_item)
-
                     # Calculate P&L using effective price
                     invested = position.quantity * position.buy_price
                     current_value = position.quantity * current_price
                     pnl = current_value - invested
                     pnl_pct = (pnl / invested * 100) if invested > 0 else 0.0
 
-                    # P&L (€)
-                    pnl_item = QTableWidgetItem(f"{pnl:+.2f}")
-                    pnl_item.setTextAlignment(
-                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                    )
-                    self.setItem(row, 5, pnl_item)
+                    new_state = (current_price, pnl, pnl_pct, is_manual)
+                    prev_state = self._price_state.get(ticker)
+                    if prev_state == new_state:
+                        continue
 
-                    # P&L %
-                    pnl_pct_item = QTableWidgetItem(f"{pnl_pct:+.2f}%")
-                    pnl_pct_item.setTextAlignment(
-                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                    )
-                    self.setItem(row, 6, pnl_pct_item)
-
-                    price_source = "manual" if is_manual else "fetched"
-                    logger.debug(
-                        "Updated prices for %s: %.2f (%s)",
-                        ticker,
-                        current_price,
-                        price_source,
+                    current_price_item = self.item(row, 4)
+                    pnl_item = self.item(row, 5)
+                    pnl_pct_item = self.item(row, 6)
+                    if not (current_price_item and pnl_item and pnl_pct_item):
+                        continue
+
+                    _set_numeric(
+                        current_price_item, current_price, f"{current_price:.2f}"
                     )
 
+                    # Restyle only when the manual/fetched source flips
+                    if prev_state is None or prev_state[3] != is_manual:
+                        if is_manual:
+                            current_price_item.setBackground(_MANUAL_PRICE_BRUSH)
+                            current_price_item.setToolTip(_MANUAL_PRICE_TOOLTIP)
+                        else:
+                            current_price_item.setBackground(_CLEAR_BRUSH)
+                            current_price_item.setToolTip("")
+
+                    _set_numeric(pnl_item, pnl, f"{pnl:+.2f}")
+                    _set_numeric(pnl_pct_item, pnl_pct, f"{pnl_pct:+.2f}%")
+                    self._price_state[ticker] = new_state
+
+                    if debug:
+                        logger.debug(
+                            "Updated prices for %s: %.2f (%s)",
+                            ticker,
+                            current_price,
+                            "manual" if is_manual else "fetched",
+                        )
+
     def _show_context_menu(self, position) -> None:  # type: ignore
         """
         Show context menu for selected row.
@@ -230,9 +419,52 @@ class PortfolioTableWidget(QTableWidget):
         """
         Set a new portfolio and refresh the table.
 
+        Rows are diffed against the new positions instead of rebuilding
+        the whole table: vanished tickers are removed, new ones appended,
+        and kept rows are only rewritten when their static fields moved.
+        Untouched rows keep their displayed prices, scroll position and
+        selection survive, and Qt churn is proportional to the change.
+
         Args:
             portfolio: New portfolio to display.
         """
         self.portfolio = portfolio
-        self._populate_table()
+        positions = portfolio.get_all_positions()
+        new_tickers = {position.ticker for position in positions}
+
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            # Drop rows whose ticker left, scanning backwards so earlier
+            # row indices stay valid while removing
+            for row in range(self.rowCount() - 1, -1, -1):
+                item = self.item(row, 0)
+                if item and item.text() not in new_tickers:
+                    self._price_state.pop(item.text(), None)
+                    self.removeRow(row)
+
+            for position in positions:
+                row = self._row_for_ticker(position.ticker)
+                if row < 0:
+                    row = self.rowCount()
+                    self.insertRow(row)
+                    self._set_row(row, position)
+                elif self._row_differs(row, position):
+                    self._set_row(row, position)
+        finally:
+            self.setSortingEnabled(sorting)
         logger.info("Portfolio table updated with new portfolio")
+
+    def _row_differs(self, row: int, position: ETFPosition) -> bool:
+        """Return True if the row's static columns don't match position."""
+        expected = (
+            position.ticker,
+            position.name,
+            str(position.quantity),
+            f"{position.buy_price:.2f}",
+        )
+        for col, text in enumerate(expected):
+            item = self.item(row, col)
+            if item is None or item.text() != text:
+                return True
+        return False
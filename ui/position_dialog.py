@@ -2,11 +2,16 @@
 Position dialog for adding or editing ETF positions.
 
 Provides a modal dialog for creating new positions or editing existing ones.
+
+The QtWidgets imports below stay at module top: the binding is already
+loaded by the application window, so they only bind names, and this module
+itself is imported lazily by the handlers that open the dialog.
 """
 
 import logging
+import re
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 
 from PyQt6.QtCore import QDate, Qt
 from PyQt6.QtWidgets import (
@@ -17,7 +22,6 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QLineEdit,
     QMessageBox,
-    QVBoxLayout,
     QWidget,
 )
 
@@ -25,6 +29,10 @@ from data.portfolio import ETFPosition
 
 logger = logging.getLogger(__name__)
 
+# Ticker format: 1-6 letters/digits, optional exchange suffix (e.g. EWLD.PA).
+# Compiled once at module scope so validation never recompiles the pattern.
+_TICKER_RE = re.compile(r"^[A-Z0-9]{1,6}(\.[A-Z]{2,4})?$")
+
 
 class PositionDialog(QDialog):
     """Dialog for adding or editing an ETF position."""
@@ -63,8 +71,9 @@ class PositionDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
 
-        # Create layout
-        layout = QVBoxLayout()
+        # Single top-level form layout: the button box rides as the last
+        # full-width row, sparing a wrapper QVBoxLayout and its extra
+        # geometry pass on show/resize
         form_layout = QFormLayout()
 
         # Ticker input
@@ -102,17 +111,15 @@ class PositionDialog(QDialog):
         self.date_input.setDisplayFormat("yyyy-MM-dd")
         form_layout.addRow("Buy Date:", self.date_input)
 
-        layout.addLayout(form_layout)
-
         # Buttons
         self.button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
-        layout.addWidget(self.button_box)
+        form_layout.addRow(self.button_box)
 
-        self.setLayout(layout)
+        self.setLayout(form_layout)
         self.setMinimumWidth(400)
 
     def _populate_fields(self) -> None:
@@ -142,28 +149,53 @@ class PositionDialog(QDialog):
         Returns:
             True if all inputs are valid, False otherwise.
         """
-        # Check ticker not empty
-        if not self.ticker_input.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Ticker cannot be empty")
-            return False
+        # Collect every problem in one pass so the user sees a single
+        # consolidated message instead of fixing fields one modal at a time
+        errors: list = []
+
+        ticker = self.ticker_input.text().strip()
+        if not ticker:
+            errors.append("Ticker cannot be empty")
+        elif not _TICKER_RE.match(ticker):
+            errors.append(
+                "Ticker must be 1-6 uppercase letters/digits, "
+                "optionally followed by an exchange suffix (e.g., EWLD.PA)"
+            )
 
-        # Check name not empty
         if not self.name_input.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Name cannot be empty")
-            return False
+            errors.append("Name cannot be empty")
 
-        # Check quantity > 0
-        if self.quantity_input.value() <= 0:
-            QMessageBox.warning(self, "Validation Error", "Quantity must be positive")
-            return False
+        # Quantity and buy price need no check here: both spinboxes are
+        # ranged 0.01-999999.99, so the widgets clamp at entry time and
+        # value() can never be non-positive
 
-        # Check buy price > 0
-        if self.buy_price_input.value() <= 0:
-            QMessageBox.warning(self, "Validation Error", "Buy price must be positive")
+        if errors:
+            QMessageBox.warning(self, "Validation Error", "\n".join(errors))
             return False
 
         return True
 
+    def open_for_result(self, callback: Callable[[], None]) -> None:
+        """
+        Show the dialog window-modally without a nested event loop.
+
+        exec() spins a nested event loop that stalls the parent window's
+        timers (auto-refresh, auto-save) for as long as the dialog is up;
+        open() keeps the main loop running while still blocking input to
+        the parent. The dialog deletes itself once finished.
+
+        Args:
+            callback: Invoked when the user accepts the dialog.
+
+        Example:
+            >>> dialog = PositionDialog(window, mode="add")
+            >>> dialog.open_for_result(lambda: print(dialog.get_position()))
+        """
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+        self.accepted.connect(callback)
+        self.finished.connect(self.deleteLater)
+        self.open()
+
     def accept(self) -> None:
         """Handle OK button click with validation."""
         if self._validate_input():
@@ -3,10 +3,16 @@ Settings dialog for configuring application preferences.
 
 Provides a modal dialog for editing user settings including currency,
 data source, auto-refresh, and chart preferences.
+
+The QtWidgets imports below stay at module top: the binding is already
+loaded by the application window, so they only bind names, and this module
+itself is imported lazily by the handler that opens the dialog.
 """
 
 import logging
-from typing import Optional
+from typing import Callable, Optional
+
+from PyQt6.QtCore import Qt
 
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -143,6 +149,11 @@ class SettingsDialog(QDialog):
         self.refresh_interval_spin.setSuffix(" minutes")
         refresh_layout.addRow("Refresh Interval:", self.refresh_interval_spin)
 
+        self.fetch_concurrency_spin = QSpinBox()
+        self.fetch_concurrency_spin.setRange(2, 16)
+        self.fetch_concurrency_spin.setSuffix(" workers")
+        refresh_layout.addRow("Max Parallel Fetches:", self.fetch_concurrency_spin)
+
         refresh_group.setLayout(refresh_layout)
         layout.addWidget(refresh_group)
 
@@ -200,6 +211,7 @@ class SettingsDialog(QDialog):
         self.data_source_combo.setCurrentText(self.settings.data_source)
         self.auto_refresh_check.setChecked(self.settings.auto_refresh_enabled)
         self.refresh_interval_spin.setValue(self.settings.auto_refresh_interval_minutes)
+        self.fetch_concurrency_spin.setValue(self.settings.max_fetch_concurrency)
 
         # Chart preferences
         self.default_chart_combo.setCurrentText(
@@ -220,6 +232,7 @@ class SettingsDialog(QDialog):
         self.settings.data_source = self.data_source_combo.currentText()
         self.settings.auto_refresh_enabled = self.auto_refresh_check.isChecked()
         self.settings.auto_refresh_interval_minutes = self.refresh_interval_spin.value()
+        self.settings.max_fetch_concurrency = self.fetch_concurrency_spin.value()
 
         # Chart preferences
         self.settings.chart_preferences.default_chart = (
@@ -245,7 +258,13 @@ class SettingsDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Could not save settings:\n{e}")
 
     def _restore_defaults(self) -> None:
-        """Restore default settings after confirmation."""
+        """
+        Restore default settings after confirmation.
+
+        get_default_settings already deep-copies a memoized template, so
+        repeated clicks cost one deepcopy, never a rebuild of the
+        dataclass tree.
+        """
         reply = QMessageBox.question(
             self,
             "Restore Defaults",
@@ -258,6 +277,23 @@ class SettingsDialog(QDialog):
             self._populate_fields()
             logger.info("Settings restored to defaults")
 
+    def open_for_result(self, callback: Callable[[], None]) -> None:
+        """
+        Show the dialog window-modally without a nested event loop.
+
+        exec() spins a nested event loop that stalls the parent window's
+        timers for as long as the dialog is up; open() keeps the main
+        loop running while still blocking input to the parent. The
+        dialog deletes itself once finished.
+
+        Args:
+            callback: Invoked when the user accepts the dialog.
+        """
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+        self.accepted.connect(callback)
+        self.finished.connect(self.deleteLater)
+        self.open()
+
     def accept(self) -> None:
         """Save settings and close dialog."""
         self._update_settings_from_fields()
@@ -4,23 +4,56 @@ Chart generation for PEA ETF Tracker.
 Provides Plotly chart creation functions for portfolio visualization.
 """
 
+import functools
 import logging
 from datetime import date
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+from plotly.colors import qualitative
 
 from config.settings import ChartPreferences
 
 logger = logging.getLogger(__name__)
 
-# Color schemes
-COLOR_SCHEMES: Dict[str, List[str]] = {
-    "plotly": px.colors.qualitative.Plotly,
-    "pastel": px.colors.qualitative.Pastel,
-    "bold": px.colors.qualitative.Bold,
+# Color schemes, frozen: tuples index a shade faster than lists and the
+# read-only proxy keeps callers from mutating the shared palettes
+COLOR_SCHEMES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "plotly": tuple(qualitative.Plotly),
+        "pastel": tuple(qualitative.Pastel),
+        "bold": tuple(qualitative.Bold),
+    }
+)
+
+# Shared layout skeletons, built once at import; each factory passes its
+# skeleton to update_layout and only the title varies per call. Plotly
+# copies the dict into the figure, so sharing them is safe.
+_VALUE_CHART_LAYOUT: Dict[str, object] = {
+    "xaxis_title": "Date",
+    "yaxis_title": "Value (EUR)",
+    "hovermode": "x unified",
+    "template": "plotly_white",
+}
+_PIE_CHART_LAYOUT: Dict[str, object] = {"template": "plotly_white"}
+_BAR_CHART_LAYOUT: Dict[str, object] = {
+    "xaxis_title": "Ticker",
+    "yaxis_title": "Value (EUR)",
+    "template": "plotly_white",
+}
+_SCATTER_CHART_LAYOUT: Dict[str, object] = {
+    "xaxis_title": "Volatility (%)",
+    "yaxis_title": "Return (%)",
+    "template": "plotly_white",
+}
+_PERFORMANCE_CHART_LAYOUT: Dict[str, object] = {
+    "xaxis_title": "Date",
+    "yaxis_title": "Price (EUR)",
+    "hovermode": "x unified",
+    "template": "plotly_white",
 }
 
 
@@ -60,24 +93,24 @@ def create_portfolio_value_chart(
 
     fig = go.Figure()
 
+    # Scattergl renders via WebGL, keeping zoom/pan responsive on
+    # multi-year daily series where SVG traces bog down past ~1k points.
+    # Traces are passed as dicts throughout this module: the constructor
+    # path validates every property twice (once building the graph
+    # object, again when add_trace copies it into the figure).
     fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=values,
-            mode="lines+markers",
-            name="Portfolio Value",
-            line={"color": "#1f77b4", "width": 2},
-            marker={"size": 6},
-        )
+        {
+            "type": "scattergl",
+            "x": dates,
+            "y": values,
+            "mode": "lines+markers",
+            "name": "Portfolio Value",
+            "line": {"color": "#1f77b4", "width": 2},
+            "marker": {"size": 6},
+        }
     )
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Date",
-        yaxis_title="Value (EUR)",
-        hovermode="x unified",
-        template="plotly_white",
-    )
+    fig.update_layout(_VALUE_CHART_LAYOUT, title=title)
 
     logger.info(f"Created portfolio value chart with {len(dates)} data points")
     return fig
@@ -120,17 +153,18 @@ def create_allocation_pie_chart(
     fig = go.Figure()
 
     fig.add_trace(
-        go.Pie(
-            labels=tickers,
-            values=percentages,
-            textinfo="label+percent",
-            hovertemplate=(
+        {
+            "type": "pie",
+            "labels": tickers,
+            "values": percentages,
+            "textinfo": "label+percent",
+            "hovertemplate": (
                 "<b>%{label}</b><br>%{percent}<br>%{value:.2f}%<extra></extra>"
             ),
-        )
+        }
     )
 
-    fig.update_layout(title=title, template="plotly_white")
+    fig.update_layout(_PIE_CHART_LAYOUT, title=title)
 
     logger.info(f"Created allocation pie chart with {len(tickers)} positions")
     return fig
@@ -173,21 +207,17 @@ def create_allocation_bar_chart(
     fig = go.Figure()
 
     fig.add_trace(
-        go.Bar(
-            x=tickers,
-            y=values,
-            name="Position Value",
-            marker={"color": "#1f77b4"},
-            hovertemplate="<b>%{x}</b><br>€%{y:.2f}<extra></extra>",
-        )
+        {
+            "type": "bar",
+            "x": tickers,
+            "y": values,
+            "name": "Position Value",
+            "marker": {"color": "#1f77b4"},
+            "hovertemplate": "<b>%{x}</b><br>€%{y:.2f}<extra></extra>",
+        }
     )
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Ticker",
-        yaxis_title="Value (EUR)",
-        template="plotly_white",
-    )
+    fig.update_layout(_BAR_CHART_LAYOUT, title=title)
 
     logger.info(f"Created allocation bar chart with {len(tickers)} positions")
     return fig
@@ -230,37 +260,92 @@ def create_risk_return_scatter(
             f"and volatilities ({len(volatilities)}) must have same length"
         )
 
-    # Convert to percentages for display
-    returns_pct = [r * 100 for r in returns]
-    volatilities_pct = [v * 100 for v in volatilities]
+    # Convert to percentages for display; Plotly consumes the ndarrays
+    # directly, so no per-element Python floats are allocated
+    returns_pct = np.asarray(returns, dtype=np.float64) * 100.0
+    volatilities_pct = np.asarray(volatilities, dtype=np.float64) * 100.0
 
     fig = go.Figure()
 
     fig.add_trace(
-        go.Scatter(
-            x=volatilities_pct,
-            y=returns_pct,
-            mode="markers+text",
-            text=tickers,
-            textposition="top center",
-            marker={"size": 12, "color": "#1f77b4"},
-            hovertemplate="<b>%{text}</b><br>"
+        {
+            "type": "scatter",
+            "x": volatilities_pct,
+            "y": returns_pct,
+            "mode": "markers+text",
+            "text": tickers,
+            "textposition": "top center",
+            "marker": {"size": 12, "color": "#1f77b4"},
+            "hovertemplate": "<b>%{text}</b><br>"
             "Return: %{y:.2f}%<br>"
             "Volatility: %{x:.2f}%<extra></extra>",
-        )
+        }
     )
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Volatility (%)",
-        yaxis_title="Return (%)",
-        template="plotly_white",
-    )
+    fig.update_layout(_SCATTER_CHART_LAYOUT, title=title)
 
     logger.info(f"Created risk-return scatter with {len(tickers)} ETFs")
     return fig
 
 
+# Longest series worth streaming to the webview: beyond this, points land
+# on the same screen pixels and only inflate render and transfer cost.
+_MAX_RENDER_POINTS = 2000
+
+
+def _lttb(dates: List[date], prices: List[float], n_out: int) -> tuple:
+    """
+    Downsample a time series with largest-triangle-three-buckets.
+
+    Keeps the first and last points, splits the interior into n_out - 2
+    buckets, and from each bucket picks the point forming the largest
+    triangle with the previously kept point and the next bucket's mean —
+    preserving peaks and troughs that uniform striding would flatten.
+
+    Args:
+        dates: X values, in order.
+        prices: Y values, same length as dates.
+        n_out: Number of points to keep.
+
+    Returns:
+        Tuple of (dates, prices) lists with n_out elements. The inputs are
+        returned unchanged if they already fit.
+    """
+    n = len(prices)
+    if n_out >= n or n_out < 3:
+        return dates, prices
+
+    # Index-based x axis: the series is (near-)daily, so sample spacing is
+    # uniform enough for triangle areas.
+    x = np.arange(n, dtype=np.float64)
+    y = np.asarray(prices, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = [0]
+    anchor = 0
+    for i in range(n_out - 2):
+        lo = edges[i]
+        hi = max(edges[i + 1], lo + 1)
+        if i < n_out - 3:
+            next_lo, next_hi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            next_lo, next_hi = n - 1, n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+
+        bucket_x = x[lo:hi]
+        bucket_y = y[lo:hi]
+        areas = np.abs(
+            (x[anchor] - avg_x) * (bucket_y - y[anchor])
+            - (x[anchor] - bucket_x) * (avg_y - y[anchor])
+        )
+        anchor = lo + int(areas.argmax())
+        kept.append(anchor)
+    kept.append(n - 1)
+
+    return [dates[i] for i in kept], [prices[i] for i in kept]
+
+
 def create_performance_chart(
     dates: List[date],
     prices: List[float],
@@ -270,6 +355,10 @@ def create_performance_chart(
     """
     Create line or candlestick chart for historical ETF performance.
 
+    Series longer than _MAX_RENDER_POINTS are decimated with LTTB before
+    the trace is built, so render cost stays constant regardless of how
+    much history was fetched.
+
     Args:
         dates: List of dates for x-axis.
         prices: List of closing prices for y-axis.
@@ -303,48 +392,63 @@ def create_performance_chart(
             f"Invalid chart_type: {chart_type}. Use 'line' or 'candlestick'"
         )
 
+    if len(prices) > _MAX_RENDER_POINTS:
+        original_count = len(prices)
+        dates, prices = _lttb(dates, prices, _MAX_RENDER_POINTS)
+        logger.info(
+            f"Decimated {ticker} series from {original_count} to "
+            f"{len(prices)} points for rendering"
+        )
+
     fig = go.Figure()
 
-    if chart_type == "line":
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=prices,
-                mode="lines",
-                name=ticker,
-                line={"color": "#1f77b4", "width": 2},
-                hovertemplate="<b>%{x}</b><br>€%{y:.2f}<extra></extra>",
-            )
-        )
-    else:
+    if chart_type != "line":
         # For candlestick, we only have close prices, so create simple candlestick
         # with open=close (would need OHLC data for proper candlestick)
         logger.warning(
             "Candlestick chart requires OHLC data. Using line chart instead."
         )
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=prices,
-                mode="lines",
-                name=ticker,
-                line={"color": "#1f77b4", "width": 2},
-                hovertemplate="<b>%{x}</b><br>€%{y:.2f}<extra></extra>",
-            )
-        )
 
-    fig.update_layout(
-        title=f"{ticker} Performance",
-        xaxis_title="Date",
-        yaxis_title="Price (EUR)",
-        hovermode="x unified",
-        template="plotly_white",
+    # WebGL trace for the same reason as create_portfolio_value_chart:
+    # historical series can run to thousands of points.
+    fig.add_trace(
+        {
+            "type": "scattergl",
+            "x": dates,
+            "y": prices,
+            "mode": "lines",
+            "name": ticker,
+            "line": {"color": "#1f77b4", "width": 2},
+            "hovertemplate": "<b>%{x}</b><br>€%{y:.2f}<extra></extra>",
+        }
     )
 
+    fig.update_layout(_PERFORMANCE_CHART_LAYOUT, title=f"{ticker} Performance")
+
     logger.info(f"Created performance chart for {ticker} with {len(dates)} data points")
     return fig
 
 
+@functools.lru_cache(maxsize=64)
+def _colors_for(scheme: str, n: int) -> tuple:
+    """
+    Get n trace colors for a scheme, cycling the palette as needed.
+
+    Cached per (scheme, trace count) so re-theming on every refresh skips
+    the per-trace modulo indexing; figures here have a handful of traces,
+    keeping the cache tiny.
+
+    Args:
+        scheme: Key into COLOR_SCHEMES.
+        n: Number of traces to color.
+
+    Returns:
+        Tuple of n color strings.
+    """
+    palette = COLOR_SCHEMES[scheme]
+    return tuple(palette[i % len(palette)] for i in range(n))
+
+
 def apply_chart_theme(
     fig: go.Figure,
     preferences: ChartPreferences,
@@ -368,25 +472,32 @@ def apply_chart_theme(
         >>> fig = go.Figure()
         >>> fig = apply_chart_theme(fig, prefs)
     """
-    # Apply grid settings
-    fig.update_xaxes(showgrid=preferences.show_grid)
-    fig.update_yaxes(showgrid=preferences.show_grid)
-
-    # Apply legend settings
-    fig.update_layout(showlegend=preferences.show_legend)
-
-    # Apply color scheme if available
-    if preferences.color_scheme in COLOR_SCHEMES:
-        colors = COLOR_SCHEMES[preferences.color_scheme]
-        # Update trace colors if traces exist
-        for i, trace in enumerate(fig.data):
-            if hasattr(trace, "marker"):
-                # Pie charts use 'colors' (plural), other charts use 'color'
-                if hasattr(trace.marker, "colors"):
-                    # Don't override pie chart colors - they're set automatically
-                    pass
-                elif hasattr(trace.marker, "color"):
-                    trace.marker.color = colors[i % len(colors)]
+    # One update_layout call covers grid and legend: each update_* call
+    # runs a full Plotly validation pass, so fusing them pays on every
+    # chart refresh
+    fig.update_layout(
+        showlegend=preferences.show_legend,
+        xaxis={"showgrid": preferences.show_grid},
+        yaxis={"showgrid": preferences.show_grid},
+    )
+
+    # "plotly" is the palette Plotly assigns on its own, so rewriting
+    # marker colors for it only re-runs the trace validator; skip that
+    # and unknown schemes alike
+    if preferences.color_scheme == "plotly" or (
+        preferences.color_scheme not in COLOR_SCHEMES
+    ):
+        logger.debug(f"Applied chart theme: {preferences.color_scheme}")
+        return fig
+
+    colors = _colors_for(preferences.color_scheme, len(fig.data))
+    # Update trace colors if traces exist. Dispatch on trace.type
+    # rather than hasattr probing: pie slices get their colors
+    # automatically, and only the marker-bearing trace kinds this module
+    # builds take a single color.
+    for i, trace in enumerate(fig.data):
+        if trace.type in ("scatter", "scattergl", "bar"):
+            trace.marker.color = colors[i]
 
     logger.debug(f"Applied chart theme: {preferences.color_scheme}")
     return fig
@@ -412,7 +523,11 @@ def export_chart_to_png(fig: go.Figure, path: Path) -> None:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Export to PNG (requires kaleido package)
+        # Export to PNG (requires kaleido package). With kaleido v1 /
+        # plotly 6+ the legacy pio.kaleido.scope warm-process API is gone;
+        # write_image drives kaleido's own engine lifecycle, and exports
+        # here are one-at-a-time, so there is no batch to amortize a
+        # persistent renderer over.
         fig.write_image(str(path))
 
         logger.info(f"Chart exported to PNG: {path}")
@@ -422,13 +537,17 @@ def export_chart_to_png(fig: go.Figure, path: Path) -> None:
         raise OSError(f"Unable to export chart to {path}: {e}") from e
 
 
-def export_chart_to_html(fig: go.Figure, path: Path) -> None:
+def export_chart_to_html(
+    fig: go.Figure, path: Path, inline_plotlyjs: bool = False
+) -> None:
     """
     Export chart to interactive HTML file.
 
     Args:
         fig: Plotly Figure object to export.
         path: Path to save HTML file.
+        inline_plotlyjs: If True, embed the ~3 MB plotly.js bundle for
+            offline viewing instead of referencing it from the CDN.
 
     Raises:
         OSError: If unable to write file.
@@ -442,9 +561,13 @@ def export_chart_to_html(fig: go.Figure, path: Path) -> None:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Export to HTML
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(fig.to_html())
+        # write_html streams straight to the file, skipping the multi-MB
+        # intermediate string to_html would build; CDN mode additionally
+        # keeps the bundle out of every exported file
+        fig.write_html(
+            str(path),
+            include_plotlyjs=True if inline_plotlyjs else "cdn",
+        )
 
         logger.info(f"Chart exported to HTML: {path}")
 